@@ -0,0 +1,239 @@
+import os
+import sqlite3
+import threading
+from collections import namedtuple
+from PIL import Image
+from ddsheader import read_dds_header
+
+CATALOG_FILE = "asset_catalog.db"
+
+# Role suffixes main.py writes (longest first, so _diffparam isn't taken for _param)
+ROLE_SUFFIXES = ("_diffparam", "_param", "_nh", "_overlay")
+
+# Files whose header is read for dimensions and format; anything else is catalogued by stat only
+IMAGE_EXTENSIONS = (".dds", ".png", ".tga", ".jpg", ".jpeg", ".bmp")
+
+CatalogEntry = namedtuple(
+    "CatalogEntry",
+    ["path", "folder", "name", "base_name", "role", "size", "mtime", "width", "height", "format", "mip_levels"],
+)
+
+COLUMNS = "path, name, base_name, role, size, mtime, width, height, format, mip_levels"
+
+_catalog = None
+
+
+def get_catalog():
+    """Returns the shared catalog, opening CATALOG_FILE on first use."""
+    global _catalog
+    if _catalog is None:
+        _catalog = Catalog()
+    return _catalog
+
+
+def get_key(path):
+    """Returns the normalized absolute path rows are keyed by."""
+    return os.path.normcase(os.path.abspath(path))
+
+
+def get_role(base_name):
+    """Returns the role suffix of a lowercased base name, or "" for a plain texture."""
+    for suffix in ROLE_SUFFIXES:
+        if base_name.endswith(suffix):
+            return suffix
+    return ""
+
+
+def read_image_info(path):
+    """Returns (width, height, format, mip levels) from an image's header, or Nones if it can't be read."""
+    if not path.lower().endswith(IMAGE_EXTENSIONS):
+        return None, None, None, None
+    try:
+        if path.lower().endswith(".dds"):
+            info = read_dds_header(path)
+            return info.width, info.height, info.format, info.mip_levels
+        with Image.open(path) as img:  # Only the header is parsed until pixels are requested
+            return img.width, img.height, img.mode, 1
+    except Exception:
+        return None, None, None, None
+
+
+class Catalog:
+    """
+    SQLite record of the files under the asset folders the tools work on.
+
+    Each row holds a file's path, base name, role suffix, size, mtime and, for images,
+    dimensions, format and mip count. refresh() and walk() bring a folder up to date by
+    comparing a scandir pass against the stored size/mtime, reading headers (when asked
+    to) only for new or changed files, so the tools query here instead of walking and
+    stat'ing themselves.
+    """
+
+    def __init__(self, db_path=CATALOG_FILE):
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")  # Other tools can read while one refreshes
+            self._connection.executescript("""
+                CREATE TABLE IF NOT EXISTS files (
+                    key TEXT PRIMARY KEY,
+                    folder_key TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    base_name TEXT NOT NULL,
+                    role TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime INTEGER NOT NULL,
+                    width INTEGER,
+                    height INTEGER,
+                    format TEXT,
+                    mip_levels INTEGER
+                );
+                CREATE INDEX IF NOT EXISTS files_folder ON files (folder_key);
+                CREATE INDEX IF NOT EXISTS files_base_name ON files (folder_key, base_name);
+            """)
+
+    def _select(self, root, recursive, columns):
+        """Runs a SELECT of columns over the rows in root (and below it when recursive)."""
+        root_key = get_key(root)
+        if recursive:
+            prefix = os.path.join(root_key, "")
+            query = f"SELECT {columns} FROM files WHERE folder_key = ? OR substr(folder_key, 1, ?) = ?"
+            parameters = (root_key, len(prefix), prefix)
+        else:
+            query = f"SELECT {columns} FROM files WHERE folder_key = ?"
+            parameters = (root_key,)
+        with self._lock:
+            return self._connection.execute(query, parameters).fetchall()
+
+    def refresh(self, root, recursive=True, read_headers=False):
+        """
+        Brings the rows under root up to date with the disk.
+
+        Returns:
+            (changed, removed): Number of files added or updated, and of rows dropped
+            because the file is gone.
+        """
+        stats = {"changed": 0, "removed": 0}
+        for _ in self.walk(root, recursive, read_headers, stats):
+            pass
+        return stats["changed"], stats["removed"]
+
+    def walk(self, root, recursive=True, read_headers=False, stats=None):
+        """
+        Brings the rows under root up to date one directory at a time, yielding
+        (folder, entries) as soon as each directory is scanned, so callers can start
+        work before the walk finishes. Rows of directories that no longer exist are
+        dropped once the walk completes.
+
+        Args:
+            read_headers: Also read dimensions, format and mip count of new or changed
+                          images (and of catalogued ones still missing them). Off by
+                          default, as it opens every changed file.
+            stats: Optional dictionary whose "changed" and "removed" counts are increased.
+        """
+        stats = stats if stats is not None else {"changed": 0, "removed": 0}
+        visited = set()
+        unreadable = set()
+
+        pending_folders = [os.path.abspath(root)]
+        while pending_folders:
+            folder = pending_folders.pop()
+            folder_key = get_key(folder)
+            visited.add(folder_key)
+            files = []
+            subfolders = []
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subfolders.append(entry.path)
+                            elif entry.is_file():
+                                files.append((entry.path, entry.stat()))
+                        except OSError:
+                            continue  # Removed while scanning
+            except OSError:
+                unreadable.add(folder_key)  # Keep its rows rather than treat the files as deleted
+                continue
+            if recursive:
+                pending_folders.extend(sorted(subfolders, key=str.lower, reverse=True))
+
+            yield folder, self._update_folder(folder_key, files, read_headers, stats)
+
+        if recursive:
+            # Folders under root that weren't reached are gone, unless a parent couldn't be read
+            removed = [(key,) for key, folder_key in self._select(root, True, "key, folder_key")
+                       if folder_key not in visited
+                       and not any(folder_key.startswith(os.path.join(parent, "")) for parent in unreadable)]
+            with self._lock, self._connection:
+                self._connection.executemany("DELETE FROM files WHERE key = ?", removed)
+            stats["removed"] += len(removed)
+
+    def _update_folder(self, folder_key, files, read_headers, stats):
+        """Updates the rows of one scanned directory and returns its CatalogEntry list, sorted by name."""
+        with self._lock:
+            known = {row[0]: row[1:] for row in self._connection.execute(
+                f"SELECT key, {COLUMNS} FROM files WHERE folder_key = ?", (folder_key,))}
+
+        # Headers are read outside the lock so queries from other threads aren't held up
+        rows = []
+        result = []
+        for path, stat in files:
+            key = get_key(path)
+            row = known.pop(key, None)
+            name = os.path.basename(path)
+            if row is not None and (row[4], row[5]) == (stat.st_size, stat.st_mtime_ns) \
+                    and not (read_headers and row[6] is None and path.lower().endswith(IMAGE_EXTENSIONS)):
+                result.append(CatalogEntry(row[0], os.path.dirname(row[0]), *row[1:]))
+                continue
+            base_name = os.path.splitext(name.lower())[0]
+            header = read_image_info(path) if read_headers else (None, None, None, None)
+            rows.append((key, folder_key, path, name, base_name, get_role(base_name),
+                         stat.st_size, stat.st_mtime_ns, *header))
+            result.append(CatalogEntry(path, os.path.dirname(path), name, base_name, get_role(base_name),
+                                       stat.st_size, stat.st_mtime_ns, *header))
+        removed = [(key,) for key in known]
+
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._connection.executemany("DELETE FROM files WHERE key = ?", removed)
+        stats["changed"] += len(rows)
+        stats["removed"] += len(removed)
+        result.sort(key=lambda entry: entry.name.lower())
+        return result
+
+    def files(self, root, recursive=True, extensions=None):
+        """
+        Returns the CatalogEntry of every file in root (and below it when recursive),
+        in the order a top-down walk would visit them.
+
+        Args:
+            extensions: Optional tuple of lowercase extensions to keep, e.g. (".dds",).
+        """
+        entries = []
+        for path, *values in self._select(root, recursive, COLUMNS):
+            if extensions and not path.lower().endswith(extensions):
+                continue
+            entries.append(CatalogEntry(path, os.path.dirname(path), *values))
+        entries.sort(key=lambda entry: (get_key(entry.folder).split(os.sep), entry.name.lower()))
+        return entries
+
+    def base_names(self, folder):
+        """Returns the set of lowercased base names of the files directly in folder."""
+        with self._lock:
+            rows = self._connection.execute("SELECT base_name FROM files WHERE folder_key = ?", (get_key(folder),))
+            return {base_name for base_name, in rows}
+
+    def get(self, path):
+        """Returns the CatalogEntry of a file, or None if it isn't catalogued."""
+        with self._lock:
+            row = self._connection.execute(f"SELECT {COLUMNS} FROM files WHERE key = ?", (get_key(path),)).fetchone()
+        if row is None:
+            return None
+        return CatalogEntry(row[0], os.path.dirname(row[0]), *row[1:])
+
+    def exists(self, path):
+        """Returns True if the file was present as of the last refresh of its folder."""
+        with self._lock:
+            return self._connection.execute("SELECT 1 FROM files WHERE key = ?", (get_key(path),)).fetchone() is not None
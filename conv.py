@@ -4,11 +4,52 @@ import subprocess
 import multiprocessing
 import json
 import math
+import hashlib
+import threading
+import queue
+import time
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, ttk, simpledialog
+import numpy as np
 from PIL import Image
+from ddsheader import read_dds_header, get_block_bytes, get_mip_chain_size, DDS_HEADER_SIZE
+from catalog import get_catalog
 
 SETTINGS_FILE = "settings.json"
+MANIFEST_FILE = "conv_manifest.json"  # Kept next to settings.json
+ANALYSIS_CACHE_FILE = "analysis_cache.json"
+VALID_EXTENSIONS = (".png", ".tga", ".dds")
+
+# Planning tasks are cheap, conversion happens in batches; small chunks keep the workers balanced
+POOL_CHUNKSIZE = 4
+MAX_IN_FLIGHT_PER_WORKER = 4 * POOL_CHUNKSIZE
+
+# texconv accepts many inputs per call; batches are grouped by output folder and format
+MAX_BATCH_FILES = 32
+MAX_COMMAND_LINE = 30000  # Windows caps CreateProcess command lines at 32767 characters
+MAX_PENDING_BATCHES_PER_WORKER = 2
+
+_pool = None
+_batch_pool = None
+_active_cancel_events = set()  # cancel_event of every process_folder call still running
+
+# Role suffixes main.py writes, mapped to the format the role needs (longest suffix first)
+ROLE_FORMATS = [
+    ("_diffparam", "BC3_UNORM"),  # Diffuse + roughness in alpha
+    ("_param", "BC3_UNORM"),      # Packed material parameters, alpha is used
+    ("_nh", "BC3_UNORM"),         # Normal + height in alpha
+    ("_overlay", "BC1_UNORM"),    # Preview overlays, colour only
+]
+
+# Textures are never suggested for downscaling below this size
+MIN_DOWNSCALE_SIZE = 256
+
+# Alpha values within this distance of 0/255 count as fully transparent/opaque
+ALPHA_TOLERANCE = 4
+# Fraction of texels allowed between the two before alpha counts as smooth
+ALPHA_SMOOTH_FRACTION = 0.001
 
 def get_texconv_exe_path():
     if getattr(sys, 'frozen', False):  # If running as PyInstaller executable
@@ -33,6 +74,87 @@ def save_settings(folders):
     with open(SETTINGS_FILE, "w") as f:
         json.dump({"folders": folders}, f)
 
+def load_manifest():
+    """Loads the conversion manifest: source path -> source stat/hash and output details."""
+    if os.path.exists(MANIFEST_FILE):
+        try:
+            with open(MANIFEST_FILE, "r") as f:
+                return json.load(f).get("files", {})
+        except json.JSONDecodeError:
+            return {}
+    return {}
+
+def save_manifest(manifest):
+    with open(MANIFEST_FILE, "w") as f:
+        json.dump({"files": manifest}, f)
+
+def get_manifest_key(path):
+    return os.path.normcase(os.path.abspath(path))
+
+def get_output_path(image_path):
+    """DDS sources are converted in place; other images get a .dds next to them."""
+    return os.path.splitext(image_path)[0] + ".dds"
+
+def calculate_md5(file_path):
+    """Calculate the MD5 hash of a file."""
+    hash_md5 = hashlib.md5()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            hash_md5.update(chunk)
+    return hash_md5.hexdigest()
+
+def is_up_to_date(image_path, size, mtime, manifest, folder_names):
+    """
+    Checks a source against the manifest using the size and mtime the caller already has.
+
+    Args:
+        image_path: Path of the source image.
+        size: Size of the source in bytes.
+        mtime: Modification time of the source in nanoseconds.
+        manifest: Manifest dictionary (updated in place when only the mtime changed).
+        folder_names: Lowercased file names in the source's folder, used to check the output exists.
+
+    Returns:
+        True if the source doesn't need to be converted again.
+    """
+    entry = manifest.get(get_manifest_key(image_path))
+    if not entry:
+        return False
+
+    output_name = os.path.basename(get_output_path(image_path)).lower()
+    if output_name not in folder_names:
+        return False
+
+    if entry["size"] != size:
+        return False
+    if entry["mtime"] == mtime:
+        return True
+
+    # Same size but touched: only reconvert if the content actually changed
+    try:
+        if calculate_md5(image_path) == entry["hash"]:
+            entry["mtime"] = mtime
+            return True
+    except OSError:
+        pass
+    return False
+
+def create_manifest_entry(image_path):
+    """Builds the manifest record for a source and its converted output."""
+    output_path = image_path if image_path.lower().endswith(".dds") else get_output_path(image_path)
+    stat = os.stat(image_path)
+    output_info = read_dds_header(output_path)
+    return {
+        "size": stat.st_size,
+        "mtime": stat.st_mtime_ns,
+        "hash": calculate_md5(image_path),
+        "output": {
+            "format": output_info.format,
+            "mips": output_info.mip_levels,
+            "size": os.path.getsize(output_path),
+        },
+    }
+
 def calculate_expected_mip_levels(width, height):
     """Calculates the expected number of mip levels for a given resolution."""
     return int(math.log2(max(width, height))) + 1
@@ -80,67 +202,715 @@ def run_texdiag_command(command, file_path):
     except Exception as e:
         return f"Error running texdiag: {e}"
 
-def has_all_mipmaps(dds_path):
-    """Checks if a DDS file has all mipmaps by comparing with calculated mip levels."""
+def get_texdiag_mip_info(dds_path):
+    """Falls back to texdiag for DDS files the native header reader can't parse."""
     output = run_texdiag_command("info", dds_path)
     
     if "Error" in output:
         print(output)
-        return False
+        return None
 
     try:
         # Extract relevant details
         details = dict(item.split(": ") for item in output.split(" | "))
         width, height = map(int, details["Resolution"].split("x"))
-        mip_levels = int(details["Mipmaps"])
-        
-        # Compare expected and actual mip levels
-        expected_mips = calculate_expected_mip_levels(width, height)
-        return mip_levels == expected_mips
+        return width, height, int(details["Mipmaps"])
 
     except Exception as e:
         print(f"Error parsing texdiag output: {e}")
     
-    return False
+    return None
+
+def has_all_mipmaps(dds_path):
+    """Checks if a DDS file has all mipmaps by comparing with calculated mip levels."""
+    try:
+        info = read_dds_header(dds_path)
+        width, height, mip_levels = info.width, info.height, info.mip_levels
+    except (OSError, ValueError) as e:
+        print(f"Error reading DDS header of {dds_path}: {e}")
+        texdiag_info = get_texdiag_mip_info(dds_path)
+        if texdiag_info is None:
+            return False
+        width, height, mip_levels = texdiag_info
+
+    # Compare expected and actual mip levels
+    expected_mips = calculate_expected_mip_levels(width, height)
+    return mip_levels == expected_mips
+
+
+def get_texture_role(image_path):
+    """Returns the role suffix of a texture name (e.g. "_nh"), or None for plain diffuse."""
+    base_name = os.path.splitext(os.path.basename(image_path))[0].lower()
+    for suffix, _ in ROLE_FORMATS:
+        if base_name.endswith(suffix):
+            return suffix
+    return None
+
+def classify_alpha(img):
+    """Classifies an image's alpha as "opaque", "binary" or "smooth" from vectorized channel statistics."""
+    if "A" not in img.getbands() and "transparency" not in img.info:
+        return "opaque"
+    if img.mode != "RGBA":
+        img = img.convert("RGBA")
+
+    alpha = np.asarray(img.getchannel("A"))
+    if alpha.min() >= 255 - ALPHA_TOLERANCE:
+        return "opaque"
+    partial = np.count_nonzero((alpha > ALPHA_TOLERANCE) & (alpha < 255 - ALPHA_TOLERANCE))
+    return "binary" if partial <= alpha.size * ALPHA_SMOOTH_FRACTION else "smooth"
+
+def plan_texture_format(image_path):
+    """
+    Picks the output format for an image from its role suffix and pixel content.
 
+    Returns:
+        A dictionary with "format", "reason", "width" and "height".
+    """
+    role = get_texture_role(image_path)
 
-def convert_image_to_dxt(image_path):
-    script_dir = os.path.dirname(os.path.abspath(__file__))
+    if image_path.lower().endswith(".dds"):
+        # Re-encoding block-compressed data only loses quality, so keep what is there
+        info = read_dds_header(image_path)
+        if get_block_bytes(info.format):
+            return {"format": info.format, "reason": "existing", "width": info.width, "height": info.height}
+
+    with Image.open(image_path) as img:
+        width, height = img.size
+        if role:
+            return {"format": dict(ROLE_FORMATS)[role], "reason": role, "width": width, "height": height}
+
+        alpha = classify_alpha(img)
+
+    # BC1 keeps 1-bit alpha, so only smooth alpha needs BC3
+    dxt_format = "BC3_UNORM" if alpha == "smooth" else "BC1_UNORM"
+    return {"format": dxt_format, "reason": f"{alpha} alpha", "width": width, "height": height}
+
+def check_and_plan_image(image_path):
+    """
+    Pool worker: decides whether an image needs converting and, if so, its format.
+
+    Returns:
+        (image_path, status, manifest_entry, plan): status is "planned", "skipped" or "failed";
+        manifest_entry is set for skipped files, plan for planned ones.
+    """
+    try:
+        skip_reason = None
+        if image_path.lower().endswith(".dds"):
+            if has_all_mipmaps(image_path):
+                skip_reason = "already has mipmaps"
+        else:
+            output_path = get_output_path(image_path)
+            if os.path.exists(output_path) and os.path.getmtime(output_path) >= os.path.getmtime(image_path) \
+                    and has_all_mipmaps(output_path):
+                skip_reason = f"{output_path} is newer"
+
+        if skip_reason:
+            print(f"Skipping {image_path}, {skip_reason}.")
+            return image_path, "skipped", create_manifest_entry(image_path), None
+
+        return image_path, "planned", None, plan_texture_format(image_path)
+    except Exception as e:
+        print(f"Error planning {image_path}: {e}")
+        return image_path, "failed", None, None
+
+def build_texconv_args(texconv_path, output_dir, format_name, image_paths=()):
+    return [texconv_path, "-nologo", "-m", "0", "-y", "-f", format_name, "-o", output_dir, *image_paths]
+
+def get_command_line_length(args):
+    return sum(len(arg) + 3 for arg in args)  # Quotes and separator
+
+def add_to_batch(batches, image_path, plan):
+    """
+    Adds a planned image to the batch for its output folder and format.
+
+    Returns:
+        (batch_key, image_paths) if adding the image filled a batch that should run now, else None.
+    """
+    output_dir = os.path.dirname(image_path)
+    batch_key = (output_dir, plan["format"])
+    batch = batches.setdefault(batch_key, [])
+
+    base_length = get_command_line_length(build_texconv_args(get_texconv_exe_path(), output_dir, plan["format"]))
+    if batch and base_length + get_command_line_length(batch + [image_path]) > MAX_COMMAND_LINE:
+        full_batch = list(batch)
+        batch[:] = [image_path]
+        return batch_key, full_batch
+
+    batch.append(image_path)
+    if len(batch) >= MAX_BATCH_FILES:
+        return batch_key, batches.pop(batch_key)
+    return None
+
+def parse_texconv_output(output, image_paths):
+    """
+    Maps texconv's console output back to per-file results.
+
+    texconv prints "reading <input>" for every file, followed by "writing <output>" on
+    success; a failure appends "FAILED (...)" to either line.
+
+    Returns:
+        A dictionary of image_path -> True if the file was written.
+    """
+    # The input path is followed by " (size, format ...)" or " FAILED (...)", and a file name can
+    # itself contain " (", so lines are matched against the known inputs, longest first
+    keys = {}
+    for path in image_paths:
+        keys[os.path.normcase(path)] = path
+        keys[os.path.normcase(os.path.abspath(path))] = path
+    keys = sorted(keys.items(), key=lambda item: len(item[0]), reverse=True)
+    results = {path: False for path in image_paths}
+    current = None
+
+    for line in output.splitlines():
+        line = line.strip()
+        if line.startswith("reading "):
+            source = os.path.normcase(line[len("reading "):])
+            current = next((path for key, path in keys if source == key or source.startswith(key + " ")), None)
+            if current and "FAILED" in line:
+                results[current] = False
+                current = None
+        elif line.startswith("writing ") and current:
+            results[current] = "FAILED" not in line
+            current = None
+
+    return results
+
+def run_texconv_batch(output_dir, format_name, image_paths):
+    """
+    Batch pool worker: converts a batch of images with a single texconv invocation.
+
+    Returns:
+        A list of (image_path, status, manifest_entry) with status "converted" or "failed".
+    """
     texconv_path = get_texconv_exe_path()
-    
     if not os.path.exists(texconv_path):
         print("Error: texconv.exe not found.")
-        return
-    
-    if image_path.lower().endswith(".dds") and has_all_mipmaps(image_path):
-        print(f"Skipping {image_path}, already has mipmaps.")
-        return
+        return [(image_path, "failed", None) for image_path in image_paths]
 
     try:
-        img = Image.open(image_path)
-        dxt_format = "dxt5" if img.mode == "RGBA" else "dxt1"
-        img.close()
-
-        output_dir = os.path.dirname(image_path)
-        args = [texconv_path, "-m", "0", "-y", "-f", dxt_format.upper(), "-o", output_dir, image_path]
-        subprocess.run(args, check=True, creationflags=subprocess.CREATE_NO_WINDOW)
-        print(f"Converted: {image_path} to {dxt_format.upper()}")
+        args = build_texconv_args(texconv_path, output_dir, format_name, image_paths)
+        result = subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                                creationflags=subprocess.CREATE_NO_WINDOW)
+        converted = parse_texconv_output(result.stdout, image_paths)
     except Exception as e:
         print(f"Error: {e}")
+        return [(image_path, "failed", None) for image_path in image_paths]
 
-def process_folder(input_folder):
-    valid_extensions = (".png", ".tga", ".dds")
-    image_files = []
-    for root, _, files in os.walk(input_folder):
-        image_files.extend(os.path.join(root, f) for f in files if f.lower().endswith(valid_extensions))
-    
-    if len(image_files) > 10:
-        confirm = messagebox.askyesno("Confirm", f"This will process {len(image_files)} files. Continue?")
-        if not confirm:
+    results = []
+    for image_path in image_paths:
+        entry = None
+        if converted[image_path]:
+            try:
+                entry = create_manifest_entry(image_path)
+                print(f"Converted: {image_path} to {format_name}")
+            except Exception as e:
+                print(f"Error recording {image_path} in manifest: {e}")
+                converted[image_path] = False
+        if not converted[image_path]:
+            print(f"Error: texconv failed to convert {image_path}")
+        results.append((image_path, "converted" if converted[image_path] else "failed", entry))
+    return results
+
+def add_to_format_report(report, image_path, plan):
+    """Accumulates a plan's projected size (full mip chain) under its folder and format."""
+    folder_report = report.setdefault(os.path.dirname(image_path), {})
+    count, size = folder_report.get(plan["format"], (0, 0))
+    projected = get_mip_chain_size(plan["format"], plan["width"], plan["height"])
+    folder_report[plan["format"]] = (count + 1, size + projected)
+
+def print_format_report(report):
+    """Prints the projected output bytes per folder and format."""
+    if not report:
+        return
+    print("Projected output sizes:")
+    for folder in sorted(report):
+        folder_total = sum(size for _, size in report[folder].values())
+        print(f"  {folder}: {folder_total / (1024 * 1024):.2f} MB")
+        for format_name, (count, size) in sorted(report[folder].items()):
+            print(f"    {format_name}: {count} file(s), {size / (1024 * 1024):.2f} MB")
+
+def get_pool():
+    """Returns the persistent worker pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        _pool = multiprocessing.Pool(processes=multiprocessing.cpu_count())
+    return _pool
+
+def get_batch_pool():
+    """
+    Returns the persistent executor texconv batches run on, creating it on first use.
+
+    Batches are kept off the planning pool: its task handler can be parked in the
+    producer waiting for in_flight, which only process_folder releases, while
+    process_folder itself waits for a batch to finish.
+    """
+    global _batch_pool
+    if _batch_pool is None:
+        _batch_pool = ThreadPoolExecutor(max_workers=multiprocessing.cpu_count())  # texconv runs as a subprocess
+    return _batch_pool
+
+def close_pool():
+    """
+    Shuts the pools down without waiting for a conversion in progress.
+
+    Running process_folder calls are cancelled first, so the planning pool drains in
+    moments; batches not started yet are dropped and texconv calls already running
+    finish in the background.
+    """
+    global _pool, _batch_pool
+    for cancel_event in list(_active_cancel_events):
+        cancel_event.set()
+    if _pool is not None:
+        _pool.close()
+        _pool.join()
+        _pool = None
+    if _batch_pool is not None:
+        _batch_pool.shutdown(wait=False, cancel_futures=True)
+        _batch_pool = None
+
+def iter_image_files(input_folder, manifest, counts, cancel_event, in_flight):
+    """
+    Walks input_folder through the asset catalog and lazily yields the images that need converting.
+
+    Each directory is recorded in the catalog and its images yielded as soon as it has
+    been scanned. Up-to-date sources are counted as skipped without being yielded.
+    in_flight is a semaphore released by the consumer for every result, so the
+    iteration never runs far ahead of the workers and a cancel takes effect immediately.
+    """
+    for folder, entries in get_catalog().walk(input_folder):
+        # Lowercased file names in the folder, for checking that a source's output exists
+        folder_names = {entry.name.lower() for entry in entries}
+
+        for entry in entries:
+            if cancel_event.is_set():
+                return
+            if not entry.name.lower().endswith(VALID_EXTENSIONS):
+                continue
+            if is_up_to_date(entry.path, entry.size, entry.mtime, manifest, folder_names):
+                counts["unchanged"] += 1  # Kept apart from "skipped", which the consumer thread updates
+                continue
+
+            while not in_flight.acquire(timeout=0.1):
+                if cancel_event.is_set():
+                    return
+            if cancel_event.is_set():
+                return
+            counts["queued"] += 1
+            yield entry.path
+    counts["scan_complete"] = True
+
+def process_folder(input_folder, progress_callback=None, cancel_event=None):
+    """
+    Converts every image under input_folder that changed since the last run.
+
+    Files stream from the directory walk straight into the persistent pool, where
+    they are checked and planned; planned files are grouped by output folder and
+    format into texconv batches on the batch pool, so conversion starts before the walk finishes.
+    Blocks until done; the GUI runs it on a background thread.
+
+    Args:
+        input_folder: Folder to convert recursively.
+        progress_callback: Called with a copy of the counts after every result.
+        cancel_event: threading.Event; once set, no new files are queued, unsent batches
+                      are dropped and batches already handed to workers are allowed to finish.
+
+    Returns:
+        A dictionary with "skipped", "converted" and "failed" counts (plus progress fields).
+    """
+    cancel_event = cancel_event or threading.Event()
+    manifest = load_manifest()
+    counts = {"skipped": 0, "unchanged": 0, "converted": 0, "failed": 0, "queued": 0, "done": 0,
+              "scan_complete": False, "cancelled": False}
+    in_flight = threading.Semaphore(MAX_IN_FLIGHT_PER_WORKER * multiprocessing.cpu_count())
+    producer = iter_image_files(input_folder, manifest, counts, cancel_event, in_flight)
+    format_report = {}
+
+    pool = get_pool()
+    batch_pool = get_batch_pool()
+    batches = {}
+    batch_results = queue.Queue()
+    max_pending_batches = MAX_PENDING_BATCHES_PER_WORKER * multiprocessing.cpu_count()
+    pending_batches = 0
+
+    def record(file_results):
+        for image_path, status, entry in file_results:
+            counts[status] += 1
+            counts["done"] += 1
+            if entry:
+                manifest[get_manifest_key(image_path)] = entry
+        if progress_callback:
+            progress_callback(dict(counts))
+
+    def submit(batch_key, image_paths):
+        nonlocal pending_batches
+        if cancel_event.is_set():
+            return  # Cancelled: batches not handed to the workers yet are dropped
+        output_dir, format_name = batch_key
+        pending_batches += 1
+
+        def on_done(future):
+            if not future.cancelled() and future.exception() is None:
+                batch_results.put(future.result())
+            else:
+                batch_results.put([(path, "failed", None) for path in image_paths])
+
+        batch_pool.submit(run_texconv_batch, output_dir, format_name, image_paths).add_done_callback(on_done)
+        # Let conversions catch up before planning further ahead
+        while pending_batches >= max_pending_batches:
+            record(batch_results.get())
+            pending_batches -= 1
+
+    _active_cancel_events.add(cancel_event)
+    try:
+        for image_path, status, entry, plan in pool.imap_unordered(check_and_plan_image, producer, chunksize=POOL_CHUNKSIZE):
+            in_flight.release()
+            if status == "planned":
+                add_to_format_report(format_report, image_path, plan)
+                full_batch = add_to_batch(batches, image_path, plan)
+                if full_batch:
+                    submit(*full_batch)
+            else:
+                record([(image_path, status, entry)])
+
+            while not batch_results.empty():
+                record(batch_results.get())
+                pending_batches -= 1
+
+        if not cancel_event.is_set():
+            for batch_key, image_paths in list(batches.items()):
+                if image_paths:
+                    submit(batch_key, image_paths)
+
+        while pending_batches:
+            record(batch_results.get())
+            pending_batches -= 1
+    finally:
+        counts["cancelled"] = cancel_event.is_set()
+        # If the loop above raised, the producer may be parked in in_flight.acquire on the
+        # pool's task handler thread, which would block every later run on the pool
+        cancel_event.set()
+        in_flight.release()
+        _active_cancel_events.discard(cancel_event)
+        save_manifest(manifest)
+
+    counts["skipped"] += counts.pop("unchanged")
+    print_format_report(format_report)
+    print(format_counts(counts))
+    return counts
+
+def load_analysis_cache():
+    """Loads cached header metadata: path -> size, mtime, dimensions and format."""
+    if os.path.exists(ANALYSIS_CACHE_FILE):
+        try:
+            with open(ANALYSIS_CACHE_FILE, "r") as f:
+                return json.load(f).get("files", {})
+        except json.JSONDecodeError:
+            return {}
+    return {}
+
+def save_analysis_cache(cache):
+    with open(ANALYSIS_CACHE_FILE, "w") as f:
+        json.dump({"files": cache}, f)
+
+def read_texture_metadata(image_path):
+    """Reads dimensions and format from the file header without decoding any pixels."""
+    if image_path.lower().endswith(".dds"):
+        info = read_dds_header(image_path)
+        return {"width": info.width, "height": info.height, "format": info.format,
+                "mips": info.mip_levels, "bits": info.bits_per_pixel, "layers": info.array_size}
+
+    with Image.open(image_path) as img:  # PIL only parses the header until pixels are requested
+        width, height = img.size
+        has_alpha = "A" in img.getbands() or "transparency" in img.info
+    # Loose images are uploaded as RGBA8 with a generated mip chain
+    return {"width": width, "height": height, "format": "R8G8B8A8_UNORM", "mips": None,
+            "bits": 32, "layers": 1, "alpha": has_alpha}
+
+def project_texture_format(image_path, metadata, manifest):
+    """Predicts the format conversion will pick, from headers, role suffix and the manifest only."""
+    if image_path.lower().endswith(".dds") and get_block_bytes(metadata["format"]):
+        return metadata["format"]
+    role = get_texture_role(image_path)
+    if role:
+        return dict(ROLE_FORMATS)[role]
+    entry = manifest.get(get_manifest_key(image_path))
+    if entry:
+        return entry["output"]["format"]
+    # Without decoding pixels an alpha channel might be smooth, so assume the larger format
+    return "BC3_UNORM" if metadata.get("alpha", True) else "BC1_UNORM"
+
+def analyze_folder(input_folder):
+    """
+    Computes the current and projected GPU memory of every texture under input_folder.
+
+    Only headers are read, and only for files whose size or mtime changed since the
+    cached analysis. When a folder holds both an image and its DDS, only the DDS is
+    counted, as that is the file the engine loads.
+
+    Returns:
+        A list of dictionaries with "path", "width", "height", "format", "current_bytes",
+        "projected_format", "projected_bytes", "disk_bytes" and "layers". Textures whose
+        format can't be sized have "unknown": True and zero bytes.
+    """
+    cache = load_analysis_cache()
+    manifest = load_manifest()
+    textures = []
+
+    catalog = get_catalog()
+    catalog.refresh(input_folder)
+    entries = catalog.files(input_folder, extensions=VALID_EXTENSIONS)
+
+    dds_names = set()  # (folder, base name) of every DDS
+    for entry in entries:
+        if entry.name.lower().endswith(".dds"):
+            dds_names.add((entry.folder, entry.base_name))
+
+    seen = set()
+    for entry in entries:
+        if not entry.name.lower().endswith(".dds") and (entry.folder, entry.base_name) in dds_names:
+            continue
+
+        key = get_manifest_key(entry.path)
+        seen.add(key)
+        cached = cache.get(key)
+        if not cached or cached["size"] != entry.size or cached["mtime"] != entry.mtime:
+            try:
+                cached = read_texture_metadata(entry.path)
+            except Exception as e:
+                print(f"Error reading {entry.path}: {e}")
+                continue
+            cached.update(size=entry.size, mtime=entry.mtime)
+            cache[key] = cached
+
+        width, height = cached["width"], cached["height"]
+        try:
+            current = get_mip_chain_size(cached["format"], width, height, cached["mips"], cached["bits"]) * cached["layers"]
+            projected_format = project_texture_format(entry.path, cached, manifest)
+            projected = get_mip_chain_size(projected_format, width, height) * cached["layers"]
+        except ValueError as e:
+            # E.g. a DXGI format the size tables don't know; listed in the report, not counted
+            print(f"Error sizing {entry.path}: {e}")
+            textures.append({
+                "path": entry.path, "width": width, "height": height, "format": cached["format"],
+                "current_bytes": 0, "projected_format": "unknown", "projected_bytes": 0,
+                "disk_bytes": entry.size, "layers": cached["layers"], "unknown": True,
+            })
+            continue
+        textures.append({
+            "path": entry.path, "width": width, "height": height, "format": cached["format"],
+            "current_bytes": current, "projected_format": projected_format, "projected_bytes": projected,
+            "disk_bytes": entry.size, "layers": cached["layers"],
+        })
+
+    # Drop entries for files under this folder that are gone; other folders' entries stay
+    prefix = os.path.join(get_manifest_key(input_folder), "")
+    cache = {key: value for key, value in cache.items() if key in seen or not key.startswith(prefix)}
+    save_analysis_cache(cache)
+    return textures
+
+def suggest_budget_fixes(textures, budget_bytes):
+    """
+    Picks the textures to downscale so the projected total fits budget_bytes.
+
+    Reformatting is already part of the projection; each halving then removes about
+    three quarters of a texture's mip chain, so the largest textures are halved first.
+
+    Returns:
+        (downscales, projected_total): downscales is a list of
+        (path, (width, height), (new_width, new_height), saved_bytes), sorted by path.
+    """
+    def projected_size(texture, width, height):
+        return get_mip_chain_size(texture["projected_format"], width, height) * texture["layers"]
+
+    total = sum(t["projected_bytes"] for t in textures)
+    heap = [(-t["projected_bytes"], i, t["width"], t["height"]) for i, t in enumerate(textures)]
+    heapq.heapify(heap)
+    targets = {}
+
+    while total > budget_bytes and heap:
+        neg_size, i, width, height = heapq.heappop(heap)
+        new_width, new_height = width // 2, height // 2
+        if min(new_width, new_height) < MIN_DOWNSCALE_SIZE:
+            continue
+        new_size = projected_size(textures[i], new_width, new_height)
+        total -= -neg_size - new_size
+        targets[i] = (new_width, new_height)
+        heapq.heappush(heap, (-new_size, i, new_width, new_height))
+
+    downscales = []
+    for i, (new_width, new_height) in targets.items():
+        texture = textures[i]
+        saved = texture["projected_bytes"] - projected_size(texture, new_width, new_height)
+        downscales.append((texture["path"], (texture["width"], texture["height"]), (new_width, new_height), saved))
+    downscales.sort()
+    return downscales, total
+
+def format_analysis_report(textures, budget_bytes=None):
+    """Builds the text report for analyze_folder's results."""
+    mb = 1024 * 1024
+    unknown = [t for t in textures if t.get("unknown")]
+    textures = [t for t in textures if not t.get("unknown")]
+    current_total = sum(t["current_bytes"] for t in textures)
+    projected_total = sum(t["projected_bytes"] for t in textures)
+    disk_total = sum(t["disk_bytes"] for t in textures)
+    projected_disk = sum(t["projected_bytes"] + DDS_HEADER_SIZE for t in textures)
+
+    lines = [
+        f"Textures: {len(textures)}",
+        f"GPU memory: {current_total / mb:.1f} MB now, {projected_total / mb:.1f} MB after conversion",
+        f"Disk: {disk_total / mb:.1f} MB now, ~{projected_disk / mb:.1f} MB after conversion",
+        "",
+        "By projected format:",
+    ]
+    by_format = {}
+    for t in textures:
+        count, current, projected = by_format.get(t["projected_format"], (0, 0, 0))
+        by_format[t["projected_format"]] = (count + 1, current + t["current_bytes"], projected + t["projected_bytes"])
+    for format_name, (count, current, projected) in sorted(by_format.items()):
+        lines.append(f"  {format_name}: {count} file(s), {current / mb:.1f} MB -> {projected / mb:.1f} MB")
+
+    reformats = sorted((t for t in textures if t["current_bytes"] > t["projected_bytes"]),
+                       key=lambda t: t["projected_bytes"] - t["current_bytes"])
+    if reformats:
+        lines += ["", "Reformat (largest savings first):"]
+        for t in reformats:
+            saved = t["current_bytes"] - t["projected_bytes"]
+            lines.append(f"  {t['path']}: {t['format']} -> {t['projected_format']}, saves {saved / mb:.2f} MB")
+
+    if budget_bytes is not None:
+        downscales, fitted_total = suggest_budget_fixes(textures, budget_bytes)
+        lines += ["", f"Budget: {budget_bytes / mb:.1f} MB"]
+        if projected_total <= budget_bytes:
+            lines.append("  Fits after conversion, no downscaling needed.")
+        else:
+            for path, (width, height), (new_width, new_height), saved in downscales:
+                lines.append(f"  Downscale {path}: {width}x{height} -> {new_width}x{new_height}, saves {saved / mb:.2f} MB")
+            status = "fits" if fitted_total <= budget_bytes else f"still over (min size {MIN_DOWNSCALE_SIZE})"
+            lines.append(f"  Result: {fitted_total / mb:.1f} MB, {status}")
+
+    if unknown:
+        lines += ["", "Unknown format (not counted above):"]
+        for t in unknown:
+            lines.append(f"  {t['path']}: {t['format']}")
+
+    return "\n".join(lines)
+
+def run_analysis_with_report(folder):
+    """Asks for an optional budget, analyzes folder on a background thread and shows the report."""
+    budget_mb = simpledialog.askfloat("VRAM Budget", "Target GPU budget in MB (Cancel for none):", parent=root, minvalue=1)
+    budget_bytes = int(budget_mb * 1024 * 1024) if budget_mb else None
+    result = {}
+
+    def worker():
+        try:
+            result["report"] = format_analysis_report(analyze_folder(folder), budget_bytes)
+        except Exception as e:
+            result["report"] = f"Analysis failed: {e}"
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    root.config(cursor="watch")
+
+    def poll():
+        if thread.is_alive():
+            root.after(100, poll)
             return
-    
-    with multiprocessing.Pool(processes=multiprocessing.cpu_count()) as pool:
-        pool.map(convert_image_to_dxt, image_files)
+        root.config(cursor="")
+        window = tk.Toplevel(root)
+        window.title(f"Analysis: {folder}")
+        text = tk.Text(window, wrap="none", width=100, height=30)
+        scrollbar = tk.Scrollbar(window, command=text.yview)
+        text.config(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        text.pack(fill=tk.BOTH, expand=True)
+        text.insert("1.0", result["report"])
+        text.config(state="disabled")
+
+    root.after(100, poll)
+
+def format_eta(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+
+def run_folder_with_progress(folder):
+    """Runs process_folder on a background thread with a progress window and a Cancel button."""
+    progress_queue = queue.Queue()
+    cancel_event = threading.Event()
+    result = {}
+
+    window = tk.Toplevel(root)
+    window.title("Converting")
+    window.geometry("400x130")
+    window.transient(root)
+    window.grab_set()
+
+    status_label = tk.Label(window, text="Scanning...")
+    status_label.pack(pady=(10, 5))
+    progress_bar = ttk.Progressbar(window, orient="horizontal", length=360, mode="determinate")
+    progress_bar.pack(pady=5)
+    eta_label = tk.Label(window, text="ETA: --")
+    eta_label.pack()
+
+    def cancel():
+        cancel_event.set()
+        cancel_button.config(state="disabled", text="Cancelling...")
+
+    cancel_button = tk.Button(window, text="Cancel", command=cancel)
+    cancel_button.pack(pady=5)
+    window.protocol("WM_DELETE_WINDOW", cancel)
+
+    def worker():
+        try:
+            result["counts"] = process_folder(folder, progress_queue.put, cancel_event)
+        except Exception as e:
+            result["error"] = e
+        progress_queue.put(None)
+
+    start_time = time.monotonic()
+
+    def poll():
+        counts = None
+        finished = False
+        while True:
+            try:
+                item = progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                finished = True
+            else:
+                counts = item
+
+        if counts:
+            total = max(counts["queued"], 1)
+            progress_bar.config(maximum=total, value=counts["done"])
+            scanning = "" if counts["scan_complete"] else " (scanning...)"
+            status_label.config(text=f"{counts['done']}/{counts['queued']}{scanning} | {format_counts(counts)}")
+            if counts["done"]:
+                elapsed = time.monotonic() - start_time
+                remaining = elapsed / counts["done"] * (counts["queued"] - counts["done"])
+                eta_label.config(text=f"ETA: {format_eta(remaining)}" + ("" if counts["scan_complete"] else "+"))
+
+        if not finished:
+            window.after(100, poll)
+            return
+
+        window.grab_release()
+        window.destroy()
+        if "error" in result:
+            messagebox.showerror("Error", f"Processing failed for: {folder}\n{result['error']}")
+            return
+        counts = result["counts"]
+        title = "Cancelled" if counts["cancelled"] else "Done"
+        messagebox.showinfo(title, f"Processing {title.lower()} for: {folder}\n{format_counts(counts)}")
+
+    threading.Thread(target=worker, daemon=True).start()
+    window.after(100, poll)
+
+def format_counts(counts):
+    skipped = counts["skipped"] + counts.get("unchanged", 0)
+    return f"Skipped: {skipped}, Converted: {counts['converted']}, Failed: {counts['failed']}"
 
 def select_folder():
     folder = filedialog.askdirectory()
@@ -150,8 +920,7 @@ def select_folder():
             previous_folders[:] = previous_folders[:5]  # Keep only the last 5 folders
             save_settings(previous_folders)
             listbox.insert(0, folder)  # Update listbox immediately
-        process_folder(folder)
-        messagebox.showinfo("Done", f"Processing complete for: {folder}")
+        run_folder_with_progress(folder)
 
 def remove_selected_folder():
     selected = listbox.curselection()
@@ -162,12 +931,12 @@ def remove_selected_folder():
         listbox.delete(selected[0])
 
 def create_gui():
-    global previous_folders, listbox
+    global previous_folders, listbox, root
     previous_folders = load_settings()
 
     root = tk.Tk()
     root.title("Image to DXT Converter")
-    root.geometry("400x300")
+    root.geometry("400x340")
 
     tk.Label(root, text="Select a folder to process images:").pack(pady=10)
     tk.Button(root, text="Browse", command=select_folder).pack(pady=5)
@@ -183,11 +952,22 @@ def create_gui():
         selected = listbox.curselection()
         if selected:
             folder = listbox.get(selected[0])
-            process_folder(folder)
-            messagebox.showinfo("Done", f"Processing complete for: {folder}")
+            run_folder_with_progress(folder)
     
+    def analyze_selected_folder():
+        selected = listbox.curselection()
+        if selected:
+            run_analysis_with_report(listbox.get(selected[0]))
+
     tk.Button(root, text="Use Selected", command=use_selected_folder).pack(pady=5)
+    tk.Button(root, text="Analyze Selected", command=analyze_selected_folder).pack(pady=5)
     tk.Button(root, text="Remove Selected", command=remove_selected_folder).pack(pady=5)
+
+    def on_close():
+        close_pool()
+        root.destroy()
+
+    root.protocol("WM_DELETE_WINDOW", on_close)
     root.mainloop()
 
 if __name__ == "__main__":
@@ -0,0 +1,299 @@
+import struct
+from collections import namedtuple
+
+DDS_MAGIC = b"DDS "
+DDS_HEADER_SIZE = 128  # Magic + DDS_HEADER
+DX10_HEADER_SIZE = 20
+
+# DDS_HEADER flags / caps
+DDSD_PITCH = 0x8
+DDSD_MIPMAPCOUNT = 0x20000
+DDSD_LINEARSIZE = 0x80000
+DDSCAPS_TEXTURE = 0x1000
+DDSCAPS2_CUBEMAP = 0x200
+
+# DDS_PIXELFORMAT flags
+DDPF_ALPHAPIXELS = 0x1
+DDPF_ALPHA = 0x2
+DDPF_FOURCC = 0x4
+DDPF_RGB = 0x40
+DDPF_LUMINANCE = 0x20000
+
+DDSInfo = namedtuple(
+    "DDSInfo",
+    ["width", "height", "depth", "mip_levels", "format", "bits_per_pixel", "array_size", "is_cubemap", "data_offset"],
+)
+
+# Legacy FourCC codes mapped to the DXGI names texdiag reports
+FOURCC_FORMATS = {
+    b"DXT1": "BC1_UNORM",
+    b"DXT2": "BC2_UNORM",
+    b"DXT3": "BC2_UNORM",
+    b"DXT4": "BC3_UNORM",
+    b"DXT5": "BC3_UNORM",
+    b"ATI1": "BC4_UNORM",
+    b"BC4U": "BC4_UNORM",
+    b"BC4S": "BC4_SNORM",
+    b"ATI2": "BC5_UNORM",
+    b"BC5U": "BC5_UNORM",
+    b"BC5S": "BC5_SNORM",
+}
+
+# D3DFMT values that legacy writers store in the FourCC field
+D3DFMT_FORMATS = {
+    36: "R16G16B16A16_UNORM",
+    111: "R16_FLOAT",
+    113: "R16G16B16A16_FLOAT",
+    114: "R32_FLOAT",
+    116: "R32G32B32A32_FLOAT",
+}
+
+DXGI_FORMATS = {
+    2: "R32G32B32A32_FLOAT",
+    10: "R16G16B16A16_FLOAT",
+    11: "R16G16B16A16_UNORM",
+    24: "R10G10B10A2_UNORM",
+    28: "R8G8B8A8_UNORM",
+    29: "R8G8B8A8_UNORM_SRGB",
+    41: "R32_FLOAT",
+    49: "R8G8_UNORM",
+    54: "R16_FLOAT",
+    56: "R16_UNORM",
+    61: "R8_UNORM",
+    65: "A8_UNORM",
+    71: "BC1_UNORM",
+    72: "BC1_UNORM_SRGB",
+    74: "BC2_UNORM",
+    75: "BC2_UNORM_SRGB",
+    77: "BC3_UNORM",
+    78: "BC3_UNORM_SRGB",
+    80: "BC4_UNORM",
+    81: "BC4_SNORM",
+    83: "BC5_UNORM",
+    84: "BC5_SNORM",
+    85: "B5G6R5_UNORM",
+    86: "B5G5R5A1_UNORM",
+    87: "B8G8R8A8_UNORM",
+    88: "B8G8R8X8_UNORM",
+    91: "B8G8R8A8_UNORM_SRGB",
+    93: "B8G8R8X8_UNORM_SRGB",
+    95: "BC6H_UF16",
+    96: "BC6H_SF16",
+    98: "BC7_UNORM",
+    99: "BC7_UNORM_SRGB",
+    115: "B4G4R4A4_UNORM",
+}
+
+# Bytes per 4x4 block for block-compressed formats
+BLOCK_BYTES = {"BC1": 8, "BC2": 16, "BC3": 16, "BC4": 8, "BC5": 16, "BC6H": 16, "BC7": 16}
+
+# Bits per pixel for the uncompressed formats above
+FORMAT_BITS = {
+    "R32G32B32A32_FLOAT": 128,
+    "R16G16B16A16_FLOAT": 64,
+    "R16G16B16A16_UNORM": 64,
+    "R10G10B10A2_UNORM": 32,
+    "R8G8B8A8_UNORM": 32,
+    "R8G8B8A8_UNORM_SRGB": 32,
+    "R32_FLOAT": 32,
+    "R8G8_UNORM": 16,
+    "R16_FLOAT": 16,
+    "R16_UNORM": 16,
+    "R8_UNORM": 8,
+    "A8_UNORM": 8,
+    "B5G6R5_UNORM": 16,
+    "B5G5R5A1_UNORM": 16,
+    "B8G8R8A8_UNORM": 32,
+    "B8G8R8X8_UNORM": 32,
+    "B8G8R8A8_UNORM_SRGB": 32,
+    "B8G8R8X8_UNORM_SRGB": 32,
+    "B8G8R8_UNORM": 24,
+    "B4G4R4A4_UNORM": 16,
+}
+
+
+def get_block_bytes(format_name):
+    """Returns the bytes per 4x4 block for a block-compressed format, or None if uncompressed."""
+    return BLOCK_BYTES.get(format_name.split("_")[0])
+
+
+def get_bits_per_pixel(format_name):
+    """Returns the bits per pixel of a format (4 or 8 for block-compressed ones), or None if unknown."""
+    block_bytes = get_block_bytes(format_name)
+    if block_bytes:
+        return block_bytes // 2
+    return FORMAT_BITS.get(format_name)
+
+
+def get_surface_size(format_name, width, height, bits_per_pixel=None):
+    """Returns the byte size of a single width x height surface in the given format."""
+    block_bytes = get_block_bytes(format_name)
+    if block_bytes:
+        return max(1, (width + 3) // 4) * max(1, (height + 3) // 4) * block_bytes
+    bits = bits_per_pixel or FORMAT_BITS.get(format_name)
+    if not bits:
+        raise ValueError(f"Unknown DDS format: {format_name}")
+    return (width * bits + 7) // 8 * height
+
+
+def get_mip_chain_size(format_name, width, height, mip_levels=None, bits_per_pixel=None):
+    """Returns the byte size of a mip chain; a full chain down to 1x1 if mip_levels is None."""
+    if mip_levels is None:
+        mip_levels = max(width, height).bit_length()
+    total = 0
+    for level in range(mip_levels):
+        total += get_surface_size(format_name, max(1, width >> level), max(1, height >> level), bits_per_pixel)
+    return total
+
+
+def _legacy_format_name(flags, fourcc, rgb_bits, r_mask, g_mask, b_mask, a_mask):
+    """Maps a legacy DDS_PIXELFORMAT to a DXGI-style format name."""
+    if flags & DDPF_FOURCC:
+        if fourcc in FOURCC_FORMATS:
+            return FOURCC_FORMATS[fourcc]
+        code = struct.unpack("<I", fourcc)[0]
+        return D3DFMT_FORMATS.get(code, fourcc.decode("ascii", "replace").strip("\x00") or "UNKNOWN")
+
+    has_alpha = flags & DDPF_ALPHAPIXELS
+    if flags & DDPF_RGB:
+        if rgb_bits == 32:
+            if r_mask == 0xFF:
+                return "R8G8B8A8_UNORM"
+            if r_mask == 0xFF0000:
+                return "B8G8R8A8_UNORM" if has_alpha and a_mask else "B8G8R8X8_UNORM"
+            if r_mask == 0x3FF:
+                return "R10G10B10A2_UNORM"
+        if rgb_bits == 24:
+            return "B8G8R8_UNORM"
+        if rgb_bits == 16:
+            if g_mask == 0x7E0:
+                return "B5G6R5_UNORM"
+            if g_mask == 0x3E0:
+                return "B5G5R5A1_UNORM"
+            if g_mask == 0xF0:
+                return "B4G4R4A4_UNORM"
+    if flags & DDPF_LUMINANCE:
+        return "R8_UNORM" if rgb_bits == 8 else "R8G8_UNORM" if has_alpha else "R16_UNORM"
+    if flags & DDPF_ALPHA:
+        return "A8_UNORM"
+    return "UNKNOWN"
+
+
+def parse_dds_header(data):
+    """
+    Parses the DDS header (and DX10 extension, if present) from raw bytes.
+
+    Args:
+        data: At least the first 148 bytes of a DDS file (128 if it has no DX10 header).
+
+    Returns:
+        DDSInfo: Header fields; format uses the DXGI names texdiag prints (e.g. "BC3_UNORM").
+
+    Raises:
+        ValueError: If the data is not a valid DDS header.
+    """
+    if len(data) < DDS_HEADER_SIZE or data[:4] != DDS_MAGIC:
+        raise ValueError("Not a DDS file")
+
+    size, flags, height, width, _pitch, depth, mip_count = struct.unpack_from("<7I", data, 4)
+    if size != 124:
+        raise ValueError(f"Invalid DDS header size: {size}")
+
+    pf_size, pf_flags, fourcc, rgb_bits, r_mask, g_mask, b_mask, a_mask = struct.unpack_from("<2I4s5I", data, 76)
+    caps2 = struct.unpack_from("<I", data, 112)[0]
+
+    mip_levels = mip_count if flags & DDSD_MIPMAPCOUNT and mip_count else 1
+    is_cubemap = bool(caps2 & DDSCAPS2_CUBEMAP)
+    array_size = 6 if is_cubemap else 1
+    data_offset = DDS_HEADER_SIZE
+
+    if pf_flags & DDPF_FOURCC and fourcc == b"DX10":
+        if len(data) < DDS_HEADER_SIZE + DX10_HEADER_SIZE:
+            raise ValueError("Truncated DX10 header")
+        dxgi_format, _dimension, misc_flag, array_size = struct.unpack_from("<4I", data, DDS_HEADER_SIZE)
+        format_name = DXGI_FORMATS.get(dxgi_format, f"DXGI_FORMAT_{dxgi_format}")
+        is_cubemap = bool(misc_flag & 0x4)
+        array_size = max(1, array_size) * (6 if is_cubemap else 1)
+        data_offset += DX10_HEADER_SIZE
+        bits_per_pixel = get_bits_per_pixel(format_name)
+    else:
+        format_name = _legacy_format_name(pf_flags, fourcc, rgb_bits, r_mask, g_mask, b_mask, a_mask)
+        bits_per_pixel = get_bits_per_pixel(format_name) or (rgb_bits if not pf_flags & DDPF_FOURCC else None)
+
+    return DDSInfo(width, height, max(1, depth), mip_levels, format_name, bits_per_pixel,
+                   array_size, is_cubemap, data_offset)
+
+
+def read_dds_header(file_path):
+    """Reads and parses the header of a DDS file without touching the pixel data."""
+    with open(file_path, "rb") as f:
+        data = f.read(DDS_HEADER_SIZE + DX10_HEADER_SIZE)
+    return parse_dds_header(data)
+
+
+def get_mip_level_offsets(info):
+    """
+    Returns where each mip level of the first surface (array slice / cube face) is stored.
+
+    Returns:
+        list: (offset, size, width, height) per mip level, offsets relative to the file start.
+    """
+    if info.depth > 1:
+        raise ValueError("Volume textures are not supported")
+    levels = []
+    offset = info.data_offset
+    for level in range(info.mip_levels):
+        width, height = max(1, info.width >> level), max(1, info.height >> level)
+        size = get_surface_size(info.format, width, height, info.bits_per_pixel)
+        levels.append((offset, size, width, height))
+        offset += size
+    return levels
+
+
+def choose_mip_level(info, min_width, min_height):
+    """Returns the smallest mip level that is still at least min_width x min_height (0 if none is)."""
+    for level in range(info.mip_levels - 1, -1, -1):
+        if max(1, info.width >> level) >= min_width and max(1, info.height >> level) >= min_height:
+            return level
+    return 0
+
+
+def extract_mip_level(data, info, level):
+    """
+    Builds a standalone single-level DDS file from one mip level of a DDS buffer.
+
+    Only that level's bytes are copied, so data can be an mmap of a large file and
+    the result handed to any DDS decoder (e.g. PIL) to decode just that level.
+
+    Args:
+        data: The whole DDS file as bytes, bytearray or mmap.
+        info: DDSInfo parsed from data.
+        level: Mip level to extract.
+
+    Returns:
+        bytes: A DDS file holding only the requested level.
+    """
+    offset, size, width, height = get_mip_level_offsets(info)[level]
+    if offset + size > len(data):
+        raise ValueError("Truncated DDS file")
+
+    header = bytearray(data[:info.data_offset])
+    flags = struct.unpack_from("<I", header, 8)[0] & ~(DDSD_MIPMAPCOUNT | DDSD_PITCH | DDSD_LINEARSIZE)
+    if get_block_bytes(info.format):
+        flags |= DDSD_LINEARSIZE
+        pitch = size
+    else:
+        flags |= DDSD_PITCH
+        pitch = size // height
+    struct.pack_into("<6I", header, 8, flags, height, width, pitch, 0, 1)
+    struct.pack_into("<2I", header, 108, DDSCAPS_TEXTURE, 0)  # Single 2D surface: no mips, no cube faces
+    if info.data_offset > DDS_HEADER_SIZE:
+        struct.pack_into("<I", header, DDS_HEADER_SIZE + 8, 0)  # DX10 miscFlag (cube)
+        struct.pack_into("<I", header, DDS_HEADER_SIZE + 12, 1)  # DX10 arraySize
+
+    return bytes(header) + bytes(data[offset:offset + size])
+
+
+def format_dds_info(info):
+    """Formats a DDSInfo the same way parse_texdiag_output does."""
+    return f"Resolution: {info.width}x{info.height} | Mipmaps: {info.mip_levels} | Format: {info.format}"
@@ -1,9 +1,21 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from PIL import Image, ImageTk, ImageOps
+import numpy as np
 import subprocess
 import os
+import io
+import mmap
 import ctypes
+import hashlib
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from imagecache import LRUImageCache
+from catalog import get_catalog
+from ddsheader import (read_dds_header, parse_dds_header, format_dds_info, choose_mip_level, extract_mip_level,
+                       DDS_HEADER_SIZE, DX10_HEADER_SIZE)
 
 try:
     ctypes.windll.shcore.SetProcessDpiAwareness(1)  # Enable DPI awareness
@@ -18,6 +30,47 @@ img_display = None
 original_img = None
 channels_selected = {"R": True, "G": True, "B": True, "A": True}
 
+# Full-resolution size of the current texture, and which of its mip levels original_img holds
+texture_size = None
+current_level = 0
+zoom_factor = 1.0
+
+# The part of original_img in view, resized to the display size as an HxWx4 uint8 array: what
+# it was built from, the zoomed display size, the (left, top, right, bottom) box of the zoomed
+# image it covers, and whether it is the LANCZOS version or the quick first paint
+display_planes = {"image": None, "size": None, "box": None, "planes": None, "refined": False}
+refine_job = None
+image_item = None
+
+# Sorted .dds paths of the open folder and their positions, rebuilt only when the folder's mtime changes
+folder_index = {"folder": None, "mtime": None, "files": [], "positions": {}}
+
+# Decode-ahead: how many files on each side of the current one, and the decoded image budget
+PREFETCH_COUNT = 3
+DECODE_CACHE_BYTES = 512 * 1024 * 1024
+
+ZOOM_STEP = 1.25
+MAX_ZOOM = 16.0
+
+# Grid mode: tile size, on-disk thumbnail cache, in-memory thumbnail budget and decode threads
+GRID_TILE_SIZE = 192
+GRID_PADDING = 10
+GRID_LABEL_HEIGHT = 20
+GRID_CACHE_DIR = "ddsv_thumbnails"
+GRID_MEMORY_BYTES = 64 * 1024 * 1024
+GRID_WORKERS = min(8, os.cpu_count() or 1)
+GRID_POLL_MS = 50
+
+# Status bar text per (path, mtime), filled in by a background lookup
+texture_info_cache = {}
+info_request = {"future": None}
+INFO_POLL_MS = 30
+
+# Grid state: tiles on the canvas (index -> PhotoImage, None while loading), their pending
+# thumbnail futures, and a generation that invalidates results from an earlier layout
+grid = {"active": False, "files": [], "columns": 0, "items": {}, "futures": {}, "generation": 0,
+        "view": None, "poll_job": None}
+
 def center_window(width, height):
     """Centers the window on the screen."""
     screen_width = root.winfo_screenwidth()
@@ -27,62 +80,299 @@ def center_window(width, height):
     root.geometry(f"{width}x{height}+{x}+{y}")
 
 
+def get_screen_box():
+    """Returns the largest area (width, height) an image is shown at before zooming."""
+    return root.winfo_screenwidth() - 50, root.winfo_screenheight() - 100
+
+
+def get_fit_size(width, height, max_width, max_height):
+    """Returns the size a width x height texture is shown at unzoomed: fit to the box, never enlarged."""
+    scale = min(max_width / width, max_height / height, 1.0)
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+def get_display_size():
+    """Returns the on-screen size of the current texture at the current zoom."""
+    fit_width, fit_height = get_fit_size(*texture_size, *get_screen_box())
+    return max(1, int(fit_width * zoom_factor)), max(1, int(fit_height * zoom_factor))
+
+
+def decode_dds(file_path, screen_box, zoom=1.0):
+    """
+    Decodes only the smallest mip level of a DDS file that covers the display size.
+
+    The file is memory-mapped and just the chosen level is copied into a
+    single-level DDS for PIL, so an 8k texture shown at 1k never decodes 8k.
+
+    Returns:
+        (image, texture_size, level): RGBA image of the level, the full-resolution
+        (width, height) and the decoded mip level.
+    """
+    try:
+        with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            info = parse_dds_header(data[:DDS_HEADER_SIZE + DX10_HEADER_SIZE])
+            fit_width, fit_height = get_fit_size(info.width, info.height, *screen_box)
+            level = choose_mip_level(info, fit_width * zoom, fit_height * zoom)
+            level_data = extract_mip_level(data, info, level)
+        with Image.open(io.BytesIO(level_data)) as img:
+            return img.convert("RGBA"), (info.width, info.height), level
+    except (OSError, ValueError, NotImplementedError):
+        pass
+
+    # Fall back to a full decode for layouts the level extraction doesn't handle
+    with Image.open(file_path) as img:
+        return img.convert("RGBA"), img.size, 0
+
+
+class DecodePrefetcher:
+    """
+    Decodes the files around the current one on a background thread.
+
+    Results go into a byte-budgeted LRU keyed by (path, mtime, zoom), so paging back
+    and forth is served from memory. Scheduling new work drops whatever was still
+    pending, and a request for a file the worker is decoding waits for that decode
+    instead of starting a second one.
+    """
+
+    def __init__(self, max_bytes):
+        self.cache = LRUImageCache(max_bytes)
+        self.pending = deque()
+        self.in_progress = {}
+        self.condition = threading.Condition()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    @staticmethod
+    def make_key(file_path, zoom):
+        return file_path, os.stat(file_path).st_mtime_ns, zoom
+
+    def schedule(self, file_paths, screen_box):
+        """Replaces the pending work with file_paths, in priority order."""
+        with self.condition:
+            self.pending.clear()
+            self.pending.extend((file_path, screen_box) for file_path in file_paths)
+            self.condition.notify()
+
+    def get(self, file_path, screen_box, zoom=1.0):
+        """Returns decode_dds's result for a file, from the cache when possible."""
+        key = self.make_key(file_path, zoom)
+        with self.condition:
+            result = self.cache.get(key)
+            event = self.in_progress.get(key)
+        if result is None and event is not None:
+            event.wait()
+            result = self.cache.get(key)
+        if result is None:
+            result = decode_dds(file_path, screen_box, zoom)
+            self._store(key, result)
+        return result
+
+    def _store(self, key, result):
+        image = result[0]
+        self.cache.put(key, result, image.width * image.height * len(image.getbands()))
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.condition.wait()
+                file_path, screen_box = self.pending.popleft()
+                try:
+                    key = self.make_key(file_path, 1.0)
+                except OSError:
+                    continue
+                if key in self.cache or key in self.in_progress:
+                    continue
+                event = self.in_progress[key] = threading.Event()
+
+            try:
+                self._store(key, decode_dds(file_path, screen_box))
+            except Exception as e:
+                print(f"Prefetch failed for {file_path}: {e}")
+            finally:
+                with self.condition:
+                    del self.in_progress[key]
+                event.set()
+
+
+def schedule_prefetch(direction):
+    """Queues the next files in the browsing direction first, then the ones behind."""
+    count = min(PREFETCH_COUNT, len(file_list) - 1)
+    ahead = [file_list[(current_file_index + direction * step) % len(file_list)] for step in range(1, count + 1)]
+    behind = [file_list[(current_file_index - direction * step) % len(file_list)] for step in range(1, count + 1)]
+    prefetcher.schedule(ahead + [path for path in behind if path not in ahead], get_screen_box())
+
+
+def get_view_box():
+    """Returns the part of the zoomed image in view as (left, top, right, bottom) display pixels."""
+    display_width, display_height = get_display_size()
+    fit_width, fit_height = get_fit_size(*texture_size, *get_screen_box())
+    left = min(max(0, int(canvas.canvasx(0))), max(0, display_width - fit_width))
+    top = min(max(0, int(canvas.canvasy(0))), max(0, display_height - fit_height))
+    return left, top, min(display_width, left + fit_width), min(display_height, top + fit_height)
+
+
+def resize_view(box, display_size, resample):
+    """Resamples just the source pixels under a box of the zoomed image, returning an HxWx4 array."""
+    left, top, right, bottom = box
+    x_scale = original_img.width / display_size[0]
+    y_scale = original_img.height / display_size[1]
+    source_box = (left * x_scale, top * y_scale, right * x_scale, bottom * y_scale)
+    return np.asarray(original_img.resize((right - left, bottom - top), resample, box=source_box))
+
+
+def get_display_planes():
+    """
+    Returns the part of the current image in view, resized to the display size, as one HxWx4 RGBA array.
+
+    Only the visible box is resampled, so memory stays at the size of the view however
+    far the image is zoomed. A new image, zoom or pan first gets a nearest-neighbour
+    resize so it can be shown straight away; the LANCZOS version replaces it once that is drawn
+    (see refine_display_planes). Channel toggles only re-slice the cached array.
+    """
+    display_size = get_display_size()
+    box = get_view_box()
+    if (display_planes["image"] is not original_img or display_planes["size"] != display_size
+            or display_planes["box"] != box):
+        if original_img.size == display_size:
+            display_planes.update(image=original_img, size=display_size, box=box,
+                                  planes=np.asarray(original_img.crop(box)), refined=True)
+        else:
+            display_planes.update(image=original_img, size=display_size, box=box,
+                                  planes=resize_view(box, display_size, Image.NEAREST), refined=False)
+    return display_planes["planes"]
+
+
+def schedule_refine():
+    """
+    Queues the high-quality resample of the current image for once the quick paint is on screen.
+
+    Idle callbacks run in the order they were queued, so the canvas redraw that
+    apply_channel_mask just queued runs first; going round the event loop once
+    more (after 1 ms) lets the drawing reach the screen before the resample blocks.
+    """
+    global refine_job
+    cancel_refine()
+    refine_job = root.after_idle(queue_refine)
+
+
+def queue_refine():
+    global refine_job
+    refine_job = root.after(1, refine_display_planes)
+
+
+def cancel_refine():
+    """Drops a pending high-quality resample, e.g. because the user moved on."""
+    global refine_job
+    if refine_job is not None:
+        root.after_cancel(refine_job)
+        refine_job = None
+
+
+def refine_display_planes():
+    """Replaces the quick first paint with a LANCZOS resample of the same view."""
+    global refine_job
+    refine_job = None
+
+    if original_img is None or display_planes["refined"] or grid["active"]:
+        return
+    if (display_planes["image"] is not original_img or display_planes["size"] != get_display_size()
+            or display_planes["box"] != get_view_box()):
+        return  # The view changed since this was scheduled
+
+    display_planes.update(planes=resize_view(display_planes["box"], display_planes["size"], Image.LANCZOS),
+                          refined=True)
+    apply_channel_mask()
+
+
+def render_channel_view(planes):
+    """
+    Builds the RGBA array shown for the selected channels from the cached planes.
+
+    A single selected RGB channel is shown as grayscale, alpha alone is shown as an
+    opaque grayscale mask, otherwise unselected colour channels are zeroed. Alpha is
+    forced opaque whenever A is off.
+    """
+    view = np.empty_like(planes)
+    rgb_selected = [index for index, ch in enumerate("RGB") if channels_selected[ch]]
+
+    if len(rgb_selected) == 1:
+        view[..., :3] = planes[..., rgb_selected[0], None]
+    elif not rgb_selected and channels_selected["A"]:
+        view[..., :3] = planes[..., 3, None]
+        view[..., 3] = 255
+        return view
+    else:
+        mask = np.array([channels_selected[ch] for ch in "RGB"], dtype=np.uint8)
+        np.multiply(planes[..., :3], mask, out=view[..., :3])
+
+    if channels_selected["A"]:
+        view[..., 3] = planes[..., 3]
+    else:
+        view[..., 3] = 255
+    return view
+
+
 def apply_channel_mask():
-    """Applies the channel mask to the original image and updates the display."""
-    global img_display, original_img
+    """Renders the selected channels of the part of the current image in view and updates the display."""
+    global img_display, image_item
 
     if original_img is None:
         return
 
-    if original_img.mode not in ("RGBA", "RGB"):
-        img_filtered = original_img  # Skip filtering for unsupported modes
+    img_view = Image.fromarray(render_channel_view(get_display_planes()), "RGBA")
+    left, top = display_planes["box"][:2]
+
+    # Same size as what is on screen: draw into the existing photo image and move it under the view
+    if img_display is not None and (img_display.width(), img_display.height()) == img_view.size:
+        img_display.paste(img_view)
+        canvas.coords(image_item, left, top)
     else:
-        # Split channels
-        r, g, b, a = original_img.split() if original_img.mode == "RGBA" else (*original_img.split(), None)
-        r = r if channels_selected["R"] else Image.new("L", original_img.size, 0)
-        g = g if channels_selected["G"] else Image.new("L", original_img.size, 0)
-        b = b if channels_selected["B"] else Image.new("L", original_img.size, 0)
-
-        # Check if a single channel is selected
-        active_channels = [ch for ch in ["R", "G", "B", "A"] if channels_selected[ch]]
-        if len(active_channels) == 1:
-            single_channel = active_channels[0]
-            # Use grayscale data of the active channel
-            single_channel_data = {"R": r, "G": g, "B": b, "A": a}[single_channel]
-            img_filtered = Image.merge("RGBA" if a else "RGB", (single_channel_data,) * 3 + ((a,) if a else ()))
-        else:
-            if a:
-                a = a if channels_selected["A"] else Image.new("L", original_img.size, 255)  # Replace alpha with full opacity
-                img_filtered = Image.merge("RGBA", (r, g, b, a))
-            else:
-                img_filtered = Image.merge("RGB", (r, g, b))
+        img_display = ImageTk.PhotoImage(img_view)
 
-    # Resize the image for display if needed
-    screen_width = root.winfo_screenwidth()
-    screen_height = root.winfo_screenheight()
-    max_width = min(img_filtered.size[0], screen_width - 50)
-    max_height = min(img_filtered.size[1], screen_height - 100)
+        # Update the canvas; when zoomed in, the image scrolls inside the unzoomed view
+        fit_width, fit_height = get_fit_size(*texture_size, *get_screen_box())
+        canvas.delete("all")
+        image_item = canvas.create_image(left, top, anchor="nw", image=img_display)
 
-    img_display_resized = img_filtered.copy()
-    if img_filtered.size[0] > max_width or img_filtered.size[1] > max_height:
-        scale_factor = min(max_width / img_filtered.size[0], max_height / img_filtered.size[1])
-        new_size = (int(img_filtered.size[0] * scale_factor), int(img_filtered.size[1] * scale_factor))
-        img_display_resized = img_filtered.resize(new_size, Image.LANCZOS)
+        # Resize the root window to fit the image width and height
+        center_window(fit_width, fit_height)
 
-    img_display = ImageTk.PhotoImage(img_display_resized)
+    # The quick paint is queued for drawing now; the LANCZOS pass follows it
+    if not display_planes["refined"]:
+        schedule_refine()
+
+
+def update_canvas_layout():
+    """Sizes the canvas to the unzoomed view and its scroll area to the zoomed image."""
+    fit_width, fit_height = get_fit_size(*texture_size, *get_screen_box())
+    canvas.config(width=fit_width, height=fit_height, scrollregion=(0, 0, *get_display_size()))
 
-    # Update the canvas
-    canvas.config(width=img_display_resized.size[0], height=img_display_resized.size[1])
-    canvas.delete("all")
-    canvas.create_image(0, 0, anchor="nw", image=img_display)
 
-    # Resize the root window to fit the image width and height
-    center_window(img_display_resized.size[0], img_display_resized.size[1])
+def pan_view(event):
+    """Drags the view and renders the part of the image that scrolled into it."""
+    canvas.scan_dragto(event.x, event.y, gain=1)
+    if not grid["active"]:
+        apply_channel_mask()
 
 
-def load_dds(file_path=None):
+def get_folder_index(folder_path):
+    """Returns the sorted DDS paths of a folder and a path -> index map, rescanning only if the folder changed."""
+    mtime = os.stat(folder_path).st_mtime_ns
+    if folder_index["folder"] != folder_path or folder_index["mtime"] != mtime:
+        catalog = get_catalog()
+        catalog.refresh(folder_path, recursive=False)
+        files = sorted(
+            os.path.normcase(os.path.join(folder_path, entry.name))
+            for entry in catalog.files(folder_path, recursive=False, extensions=(".dds",))
+        )
+        folder_index.update(folder=folder_path, mtime=mtime, files=files,
+                            positions={path: index for index, path in enumerate(files)})
+    return folder_index["files"], folder_index["positions"]
+
+
+def load_dds(file_path=None, direction=1):
     """Loads a DDS file, displays its info, updates the status bar, and sets the title."""
-    global img_display, current_file_index, file_list, original_img
+    global img_display, current_file_index, file_list, original_img, texture_size, current_level, zoom_factor
 
     if file_path is None:
         file_path = filedialog.askopenfilename(
@@ -93,24 +383,31 @@ def load_dds(file_path=None):
     if not file_path:
         return
 
+    cancel_refine()  # Don't spend idle time on the file being left
+    close_grid()
+
     try:
-        folder_path = os.path.dirname(file_path)
-        file_list = sorted(
-            [os.path.normcase(os.path.abspath(os.path.join(folder_path, f))) for f in os.listdir(folder_path) if f.lower().endswith(".dds")]
-        )
         file_path = os.path.normcase(os.path.abspath(file_path))
-        current_file_index = file_list.index(file_path)
-
-        with Image.open(file_path) as img:
-            original_img = img.convert("RGBA")  # Ensure RGBA mode for consistency
-            apply_channel_mask()  # Apply the initial channel mask
+        file_list, positions = get_folder_index(os.path.dirname(file_path))
+        if file_path not in positions:
+            raise FileNotFoundError(f"{file_path} is no longer in its folder")
+        current_file_index = positions[file_path]
+
+        zoom_factor = 1.0
+        original_img, texture_size, current_level = prefetcher.get(file_path, get_screen_box())
+        update_canvas_layout()
+        canvas.xview_moveto(0)
+        canvas.yview_moveto(0)
+        apply_channel_mask()  # Apply the initial channel mask
 
         # Update status bar and window title
-        texdiag_info = run_texdiag_command("info", file_path)
-        status_text.set(texdiag_info)
+        show_texture_info(file_path)
         filename = os.path.basename(file_path)
         root.title(f"{filename} ({current_file_index + 1}/{len(file_list)}) - DDS Viewer with TexDiag")
 
+        # Decode the neighbours while the user looks at this one
+        schedule_prefetch(direction)
+
     except Exception as e:
         messagebox.showerror("Error", f"Failed to load DDS file: {e}")
 
@@ -118,38 +415,322 @@ def navigate_files(direction):
     """Navigate to the previous or next DDS file."""
     global current_file_index
 
-    if not file_list:
+    if not file_list or grid["active"]:
         return
 
     current_file_index = (current_file_index + direction) % len(file_list)
-    load_dds(file_list[current_file_index])
+    load_dds(file_list[current_file_index], direction)
+
+def set_zoom(new_zoom):
+    """Zooms the view, decoding a larger mip level if the current one is too small."""
+    global zoom_factor, original_img, texture_size, current_level
+
+    if original_img is None or grid["active"]:
+        return
+
+    new_zoom = min(max(new_zoom, 1.0), MAX_ZOOM)
+    if new_zoom == zoom_factor:
+        return
+
+    # Keep the point at the center of the view in place
+    x_view, y_view = canvas.xview(), canvas.yview()
+    x_center, y_center = (x_view[0] + x_view[1]) / 2, (y_view[0] + y_view[1]) / 2
+
+    zoom_factor = new_zoom
+    display_width, display_height = get_display_size()
+    if current_level > 0 and (original_img.size[0] < display_width or original_img.size[1] < display_height):
+        try:
+            original_img, texture_size, current_level = prefetcher.get(file_list[current_file_index], get_screen_box(), zoom_factor)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load DDS file: {e}")
+            return
+
+    update_canvas_layout()
+    fit_width, fit_height = get_fit_size(*texture_size, *get_screen_box())
+    canvas.xview_moveto(x_center - fit_width / display_width / 2)
+    canvas.yview_moveto(y_center - fit_height / display_height / 2)
+    apply_channel_mask()
+
+
+def on_mouse_wheel(event):
+    """Zooms in or out with the mouse wheel (Windows delta or X11 buttons 4/5); scrolls in grid mode."""
+    if grid["active"]:
+        canvas.yview_scroll(1 if getattr(event, "num", None) == 5 or getattr(event, "delta", 0) < 0 else -1, "units")
+        return
+    if getattr(event, "num", None) == 5 or getattr(event, "delta", 0) < 0:
+        set_zoom(zoom_factor / ZOOM_STEP)
+    else:
+        set_zoom(zoom_factor * ZOOM_STEP)
+
+
+def get_thumbnail_cache_path(file_path, mtime_ns, tile_size):
+    """Returns where the thumbnail of one version of a file is stored on disk."""
+    key = hashlib.md5(f"{file_path}|{mtime_ns}|{tile_size}".encode("utf-8")).hexdigest()
+    return os.path.join(GRID_CACHE_DIR, f"{key}.png")
+
+
+def make_thumbnail(file_path, tile_size):
+    """
+    Returns an RGBA thumbnail of a DDS file that fits in tile_size x tile_size.
+
+    Thumbnails are decoded from the smallest mip level that covers the tile and
+    stored as PNGs named after (path, mtime), so unchanged files are never decoded
+    twice and a rewritten file gets a fresh thumbnail. Runs on the grid workers.
+    """
+    mtime_ns = os.stat(file_path).st_mtime_ns
+    key = (file_path, mtime_ns, tile_size)
+    thumbnail = thumbnail_memory.get(key)
+    if thumbnail is not None:
+        return thumbnail
+
+    cache_path = get_thumbnail_cache_path(file_path, mtime_ns, tile_size)
+    try:
+        with Image.open(cache_path) as cached:
+            thumbnail = cached.convert("RGBA")
+    except (OSError, ValueError):
+        thumbnail, _, _ = decode_dds(file_path, (tile_size, tile_size))
+        thumbnail.thumbnail((tile_size, tile_size), Image.LANCZOS)
+        try:
+            os.makedirs(GRID_CACHE_DIR, exist_ok=True)
+            temp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+            thumbnail.save(temp_path, "PNG")
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            print(f"Could not cache thumbnail for {file_path}: {e}")
+
+    thumbnail_memory.put(key, thumbnail, thumbnail.width * thumbnail.height * 4)
+    return thumbnail
+
+
+def get_grid_cell_size():
+    """Returns the (width, height) of one grid cell including its label and padding."""
+    return GRID_TILE_SIZE + GRID_PADDING, GRID_TILE_SIZE + GRID_LABEL_HEIGHT + GRID_PADDING
+
+
+def get_tile_origin(index):
+    """Returns the canvas position of the top-left corner of a tile."""
+    cell_width, cell_height = get_grid_cell_size()
+    row, column = divmod(index, grid["columns"])
+    return column * cell_width + GRID_PADDING // 2, row * cell_height + GRID_PADDING // 2
+
+
+def request_tile(index):
+    """Queues the thumbnail of a tile on the grid workers."""
+    generation = grid["generation"]
+    future = thumbnail_pool.submit(make_thumbnail, grid["files"][index], GRID_TILE_SIZE)
+    future.add_done_callback(lambda done: grid_results.put((generation, index, done)))
+    grid["futures"][index] = future
+
+
+def clear_grid_tiles():
+    """Removes every tile from the canvas and cancels the thumbnails not started yet."""
+    for future in grid["futures"].values():
+        future.cancel()
+    canvas.delete("all")
+    grid.update(items={}, futures={}, generation=grid["generation"] + 1)
+
+
+def update_grid():
+    """Lays out the grid for the canvas size and creates tiles only for the rows in view."""
+    cell_width, cell_height = get_grid_cell_size()
+    columns = max(1, canvas.winfo_width() // cell_width)
+    if columns != grid["columns"]:
+        clear_grid_tiles()  # Every tile moves, so start the layout over
+        grid["columns"] = columns
+        rows = -(-len(grid["files"]) // columns)
+        canvas.config(scrollregion=(0, 0, columns * cell_width, rows * cell_height))
+
+    # The rows in view plus one on each side, so scrolling a little doesn't show blanks
+    top = canvas.canvasy(0)
+    first_row = max(0, int(top // cell_height) - 1)
+    last_row = int((top + canvas.winfo_height()) // cell_height) + 2
+    visible = range(first_row * columns, min(len(grid["files"]), last_row * columns))
+
+    for index in [index for index in grid["items"] if index not in visible]:
+        canvas.delete(f"tile{index}")
+        del grid["items"][index]
+        future = grid["futures"].pop(index, None)
+        if future is not None:
+            future.cancel()
+
+    for index in visible:
+        if index in grid["items"]:
+            continue
+        x, y = get_tile_origin(index)
+        tag = f"tile{index}"
+        name = os.path.basename(grid["files"][index])
+        if len(name) > 28:
+            name = name[:25] + "..."
+        canvas.create_rectangle(x, y, x + GRID_TILE_SIZE, y + GRID_TILE_SIZE, outline="darkgray", tags=(tag,))
+        canvas.create_text(x + GRID_TILE_SIZE // 2, y + GRID_TILE_SIZE + 2, anchor="n", text=name, tags=(tag,))
+        grid["items"][index] = None
+        request_tile(index)
+
+
+def poll_grid():
+    """Re-lays out the grid when the view moved and puts finished thumbnails on the canvas."""
+    if not grid["active"]:
+        return
+
+    view = (canvas.canvasy(0), canvas.winfo_width(), canvas.winfo_height())
+    if view != grid["view"]:
+        grid["view"] = view
+        update_grid()
+
+    while True:
+        try:
+            generation, index, future = grid_results.get_nowait()
+        except queue.Empty:
+            break
+        if generation != grid["generation"] or grid["futures"].get(index) is not future:
+            continue  # The tile scrolled away or the grid was laid out again
+        del grid["futures"][index]
+
+        x, y = get_tile_origin(index)
+        try:
+            thumbnail = future.result()
+        except Exception as e:
+            print(f"Thumbnail failed for {grid['files'][index]}: {e}")
+            canvas.create_text(x + GRID_TILE_SIZE // 2, y + GRID_TILE_SIZE // 2, text="Error", tags=(f"tile{index}",))
+            continue
+        photo = grid["items"][index] = ImageTk.PhotoImage(thumbnail)
+        canvas.create_image(x + GRID_TILE_SIZE // 2, y + GRID_TILE_SIZE // 2, image=photo, tags=(f"tile{index}",))
+
+    grid["poll_job"] = root.after(GRID_POLL_MS, poll_grid)
+
+
+def open_grid():
+    """Shows the current folder (or one picked now) as a scrollable contact sheet."""
+    global img_display
+
+    files = file_list
+    if not files:
+        folder = filedialog.askdirectory(title="Select a folder of DDS files")
+        if not folder:
+            return
+        files, _ = get_folder_index(os.path.normcase(os.path.abspath(folder)))
+    if not files:
+        messagebox.showinfo("Grid", "No DDS files in this folder.")
+        return
+
+    cancel_refine()
+    img_display = None  # Its canvas item goes away with the single view
+    canvas.delete("all")
+    grid.update(active=True, files=list(files), columns=0, items={}, futures={}, view=None)
+
+    _, cell_height = get_grid_cell_size()
+    width, height = get_screen_box()
+    canvas.config(width=width, height=height, yscrollincrement=cell_height, xscrollincrement=0)
+    center_window(width, height)
+    canvas.xview_moveto(0)
+    canvas.yview_moveto(0)
+
+    status_text.set(f"{len(files)} DDS files | Double-click a tile to open it, G to go back")
+    root.title(f"{os.path.dirname(files[0])} - DDS Viewer with TexDiag")
+    poll_grid()
+
+
+def close_grid():
+    """Leaves grid mode, dropping its tiles and the thumbnails still queued."""
+    if not grid["active"]:
+        return
+    grid["active"] = False
+    if grid["poll_job"] is not None:
+        root.after_cancel(grid["poll_job"])
+        grid["poll_job"] = None
+    clear_grid_tiles()
+    canvas.config(yscrollincrement=0)
+
+
+def toggle_grid():
+    """Switches between the single-file view and the grid."""
+    if not grid["active"]:
+        open_grid()
+        return
+
+    close_grid()
+    if original_img is not None:
+        update_canvas_layout()
+        canvas.xview_moveto(0)
+        canvas.yview_moveto(0)
+        apply_channel_mask()
+        file_path = file_list[current_file_index]
+        show_texture_info(file_path)
+        root.title(f"{os.path.basename(file_path)} ({current_file_index + 1}/{len(file_list)}) - DDS Viewer with TexDiag")
+    else:
+        status_text.set("No file loaded")
+
+
+def on_grid_double_click(event):
+    """Opens the double-clicked tile in the single-file view."""
+    if not grid["active"] or not grid["columns"]:
+        return
+    cell_width, cell_height = get_grid_cell_size()
+    column = int(canvas.canvasx(event.x) // cell_width)
+    index = int(canvas.canvasy(event.y) // cell_height) * grid["columns"] + column
+    if column < grid["columns"] and index < len(grid["files"]):
+        load_dds(grid["files"][index])
+
 
 def toggle_channel(channel):
-    """Toggles the selected RGBA channel, and if only one channel is active, copies it to the others."""
+    """Toggles the selected RGBA channel; a single active RGB channel is shown as grayscale."""
     channels_selected[channel] = channel_vars[channel].get()
 
-    # Check if exactly one RGB channel is selected
-    active_channels = [ch for ch in ["R", "G", "B"] if channels_selected[ch]]
-    if len(active_channels) == 1:
-        active_channel = active_channels[0]
-
-        # Copy the active channel's data to the other channels
-        global original_img
-        if original_img and original_img.mode in ("RGBA", "RGB"):
-            r, g, b, a = original_img.split() if original_img.mode == "RGBA" else (*original_img.split(), None)
-            selected_channel_data = {"R": r, "G": g, "B": b}[active_channel]
-
-            # Duplicate the active channel's data to the other channels
-            r, g, b = (selected_channel_data, selected_channel_data, selected_channel_data)
-            if a:
-                original_img = Image.merge("RGBA", (r, g, b, a))
-            else:
-                original_img = Image.merge("RGB", (r, g, b))
-
-    # Refresh the display with the updated image
+    # Re-render from the cached display planes; the decoded image is never modified
     apply_channel_mask()
 
 
+def show_texture_info(file_path):
+    """
+    Puts a file's info in the status bar without blocking on texdiag.
+
+    Known (path, mtime) pairs are answered from memory; anything else is looked up
+    on a worker thread, and the answer is only shown if the file is still open.
+    """
+    try:
+        key = (file_path, os.stat(file_path).st_mtime_ns)
+    except OSError:
+        key = None
+    if key in texture_info_cache:
+        status_text.set(texture_info_cache[key])
+        return
+
+    # A lookup for a file already left is skipped if it hasn't started yet
+    if info_request["future"] is not None:
+        info_request["future"].cancel()
+    status_text.set("Reading texture info...")
+    info_request["future"] = info_pool.submit(get_texture_info, file_path)
+    poll_texture_info(file_path, key, info_request["future"])
+
+
+def poll_texture_info(file_path, key, future):
+    """Waits for a background info lookup, then caches it and shows it if still relevant."""
+    if not future.done():
+        root.after(INFO_POLL_MS, poll_texture_info, file_path, key, future)
+        return
+    if future.cancelled():
+        return
+
+    try:
+        info = future.result()
+    except Exception as e:
+        info = f"Error reading texture info: {e}"
+    if key is not None and not info.startswith("Error"):
+        texture_info_cache[key] = info
+
+    # The user may have moved to another file or the grid in the meantime
+    if not grid["active"] and file_list and file_list[current_file_index] == file_path:
+        status_text.set(info)
+
+
+def get_texture_info(file_path):
+    """Returns the status bar text for a DDS file, reading its header natively when possible."""
+    try:
+        return format_dds_info(read_dds_header(file_path))
+    except (OSError, ValueError):
+        return run_texdiag_command("info", file_path)  # Fallback for headers we can't parse
+
+
 def run_texdiag_command(command, file_path):
     """Runs a specified texdiag command on the DDS file and returns parsed output."""
     texdiag_path = "texdiag.exe"
@@ -198,6 +779,17 @@ def update_status_bar_position():
     status_bar_height = status_bar.winfo_reqheight()
     status_bar.place(x=0, y=root.winfo_height() - status_bar_height, width=status_bar_width)
 
+# Background decoder shared by navigation and zoom
+prefetcher = DecodePrefetcher(DECODE_CACHE_BYTES)
+
+# Grid thumbnails: threads rather than processes, since importing this module opens the window
+thumbnail_pool = ThreadPoolExecutor(max_workers=GRID_WORKERS)
+thumbnail_memory = LRUImageCache(GRID_MEMORY_BYTES)
+grid_results = queue.Queue()
+
+# One thread is enough for status bar lookups; they are only ever for the current file
+info_pool = ThreadPoolExecutor(max_workers=1)
+
 # Create the main Tkinter window
 root = tk.Tk()
 root.title("DDS Viewer with TexDiag")
@@ -251,9 +843,36 @@ for channel in ["R", "G", "B", "A"]:
         command=lambda c=channel: toggle_channel(c),
     )
 
+# View menu for zooming
+view_menu = tk.Menu(menu, tearoff=0)
+menu.add_cascade(label="View", menu=view_menu)
+view_menu.add_command(label="Zoom In (+)", command=lambda: set_zoom(zoom_factor * ZOOM_STEP))
+view_menu.add_command(label="Zoom Out (-)", command=lambda: set_zoom(zoom_factor / ZOOM_STEP))
+view_menu.add_command(label="Fit (0)", command=lambda: set_zoom(1.0))
+view_menu.add_separator()
+view_menu.add_command(label="Grid (G)", command=toggle_grid)
+
 # Key bindings for left and right arrow keys
 root.bind("<Left>", lambda event: navigate_files(-1))
 root.bind("<Right>", lambda event: navigate_files(1))
 
+# Zoom with the mouse wheel or +/-/0, pan by dragging
+root.bind("<MouseWheel>", on_mouse_wheel)
+root.bind("<Button-4>", on_mouse_wheel)
+root.bind("<Button-5>", on_mouse_wheel)
+root.bind("<plus>", lambda event: set_zoom(zoom_factor * ZOOM_STEP))
+root.bind("<equal>", lambda event: set_zoom(zoom_factor * ZOOM_STEP))
+root.bind("<minus>", lambda event: set_zoom(zoom_factor / ZOOM_STEP))
+root.bind("<Key-0>", lambda event: set_zoom(1.0))
+canvas.bind("<ButtonPress-1>", lambda event: canvas.scan_mark(event.x, event.y))
+canvas.bind("<B1-Motion>", pan_view)
+
+# Grid mode: G toggles it, double-click opens a tile
+root.bind("<g>", lambda event: toggle_grid())
+root.bind("<G>", lambda event: toggle_grid())
+canvas.bind("<Double-Button-1>", on_grid_double_click)
+
 # Run the Tkinter main loop
 root.mainloop()
+thumbnail_pool.shutdown(wait=False, cancel_futures=True)
+info_pool.shutdown(wait=False, cancel_futures=True)
@@ -1,26 +1,27 @@
 import os
 import re
+import sys
+from esmreader import get_texture_names
+from catalog import get_catalog
 
-def find_missing_alternatives(folder_path, text_file_path):
-    """
-    Finds texture names in a text file that have a corresponding base texture
-    in a folder, but are missing the "_diffparam" alternative.
-    Completely ignores file extensions.
+# Alternatives a terrain texture is expected to have: (rule name, suffix added to the base name)
+SUFFIX_RULES = [
+    ("diffparam", "_diffparam"),
+    ("nh", "_nh"),
+    ("param", "_param"),
+    ("overlay", "_overlay"),
+]
 
-    Args:
-        folder_path: Path to the folder containing texture files.
-        text_file_path: Path to the text file containing texture names.
+def read_texture_names(text_file_path):
+    """
+    Reads one texture name per line, lowercased, skipping blank lines.
 
     Returns:
-        A list of base texture names that are missing their "_diffparam" alternative,
-        or None if there's an error reading files.
+        A list of names, or None if the file can't be read.
     """
-
-
-
     try:
         with open(text_file_path, 'r') as f:
-            texture_names_from_text = [line.strip().lower() for line in f]  # Lowercase on read
+            return [line.strip().lower() for line in f if line.strip()]  # Lowercase on read
     except FileNotFoundError:
         print(f"Error: Text file '{text_file_path}' not found.")
         return None
@@ -28,40 +29,126 @@ def find_missing_alternatives(folder_path, text_file_path):
         print(f"Error reading text file: {e}")
         return None
 
-    try:
-        texture_files_in_folder = [f.lower() for f in os.listdir(folder_path)] # Lowercase folder files immediately
-    except FileNotFoundError:
+def index_base_names(folder_path):
+    """
+    Refreshes a folder in the asset catalog and returns the set of its lowercased file names without extensions.
+
+    Returns:
+        A set of base names, or None if the folder can't be read.
+    """
+    if not os.path.isdir(folder_path):
         print(f"Error: Folder '{folder_path}' not found.")
         return None
+    try:
+        catalog = get_catalog()
+        catalog.refresh(folder_path, recursive=False)
+        return catalog.base_names(folder_path)
     except Exception as e:
         print(f"Error reading folder: {e}")
         return None
 
-    missing_alternatives = []
-
-    for texture_name_from_text in texture_names_from_text:
-        base_name = os.path.splitext(texture_name_from_text)[0] # remove extension from txt name
-        base_found = False
-        for file_name in texture_files_in_folder:
-            if os.path.splitext(file_name)[0] == base_name: #compare without extension
-                base_found = True
-                diffparam_name = base_name + "_diffparam"
-                diffparam_found = False
-                for file_name2 in texture_files_in_folder: #second loop to find the diffparam
-                    if os.path.splitext(file_name2)[0] == diffparam_name:
-                        diffparam_found = True
-                        break
-                if not diffparam_found:
-                    missing_alternatives.append(base_name)
-                break # stop the loop after finding the base
-        
-    return missing_alternatives
+def audit_alternatives(texture_names, folders, rules=SUFFIX_RULES, folder_rules=None):
+    """
+    Checks every texture against every suffix rule in every folder, listing each folder once.
+
+    A texture is audited if its base name is present in at least one of the folders;
+    names that exist nowhere are not ours and are left out. Extensions and case are ignored.
+
+    Args:
+        texture_names: Texture names, e.g. from read_texture_names.
+        folders: Dictionary of column label -> folder path (e.g. staging and openmwassets).
+        rules: (rule name, suffix) pairs checked in every folder.
+        folder_rules: Optional column label -> rules, overriding rules for that folder
+                      (e.g. only the overlay rule for staging/overlay).
+
+    Returns:
+        Dictionary of base name -> {column label: list of missing rule names}, in the
+        order the names were given, or None if a folder can't be read.
+    """
+    indexes = {}
+    for label, folder_path in folders.items():
+        indexes[label] = index_base_names(folder_path)
+        if indexes[label] is None:
+            return None
+
+    folder_rules = folder_rules or {}
+    matrix = {}
+    for texture_name in texture_names:
+        base_name = os.path.splitext(texture_name.lower())[0]  # remove extension from txt name
+        if base_name in matrix or not any(base_name in index for index in indexes.values()):
+            continue
+        matrix[base_name] = {
+            label: [rule_name for rule_name, suffix in folder_rules.get(label, rules)
+                    if base_name + suffix not in index]
+            for label, index in indexes.items()
+        }
+    return matrix
+
+def format_audit_matrix(matrix):
+    """Formats an audit matrix as a text table: one row per texture, one column per folder."""
+    if not matrix:
+        return "No textures to audit."
+    labels = list(next(iter(matrix.values())))
+    name_width = max(len("texture"), *(len(name) for name in matrix))
+    column_widths = [max(len(label), *(len(", ".join(row[label]) or "ok") for row in matrix.values()))
+                     for label in labels]
+
+    lines = ["  ".join(["texture".ljust(name_width)] + [label.ljust(width) for label, width in zip(labels, column_widths)])]
+    for base_name, row in matrix.items():
+        cells = [(", ".join(row[label]) or "ok").ljust(width) for label, width in zip(labels, column_widths)]
+        lines.append("  ".join([base_name.ljust(name_width)] + cells).rstrip())
+    return "\n".join(lines)
+
+def find_missing_alternatives(folder_path, text_file_path=None, texture_names=None):
+    """
+    Finds texture names in a text file that have a corresponding base texture
+    in a folder, but are missing the "_diffparam" alternative.
+    Completely ignores file extensions.
+
+    Args:
+        folder_path: Path to the folder containing texture files.
+        text_file_path: Path to the text file containing texture names.
+        texture_names: Texture names to use instead of a text file, e.g. from
+                       esmreader.get_texture_names.
+
+    Returns:
+        A list of base texture names that are missing their "_diffparam" alternative,
+        or None if there's an error reading files.
+    """
+    if texture_names is None:
+        texture_names = read_texture_names(text_file_path)
+        if texture_names is None:
+            return None
+
+    matrix = audit_alternatives(texture_names, {"folder": folder_path}, rules=[("diffparam", "_diffparam")])
+    if matrix is None:
+        return None
+    return [base_name for base_name, row in matrix.items() if row["folder"]]
 
 if __name__ == "__main__":
     text_file_path = "terrain_dump.txt"
     folder_path = "staging/textures/"
-    
-    missing = find_missing_alternatives(folder_path, text_file_path)
+
+    # Plugins given on the command line (in load order) replace terrain_dump.txt
+    plugins = [arg for arg in sys.argv[1:] if arg.lower().endswith((".esm", ".esp"))]
+    names = get_texture_names(plugins) if plugins else None
+
+    if "--matrix" in sys.argv[1:]:
+        # Every rule for the staged and deployed textures, overlays from their own folder
+        if names is None:
+            names = read_texture_names(text_file_path)
+        if names is not None:
+            matrix = audit_alternatives(
+                names,
+                {"staging": folder_path, "openmwassets": "staging/openmwassets/textures", "overlay": "staging/overlay/"},
+                rules=[rule for rule in SUFFIX_RULES if rule[0] != "overlay"],
+                folder_rules={"overlay": [("overlay", "_overlay")]},
+            )
+            if matrix is not None:
+                print(format_audit_matrix(matrix))
+        sys.exit()
+
+    missing = find_missing_alternatives(folder_path, text_file_path, names)
 
     if missing is not None:
         if missing:
@@ -69,4 +156,4 @@ if __name__ == "__main__":
             for item in missing:
                 print(item)
         else:
-            print("No missing _diffparam alternatives found.")
\ No newline at end of file
+            print("No missing _diffparam alternatives found.")
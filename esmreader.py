@@ -0,0 +1,212 @@
+import os
+import sys
+import time
+import struct
+import tempfile
+import tracemalloc
+
+RECORD_HEADER = struct.Struct("<4sIII")  # Type, data size, unused, flags
+SUBRECORD_HEADER = struct.Struct("<4sI")  # Type, data size
+RECORD_DELETED = 0x20
+
+# Subrecords holding texture paths, per record type (LTEX DATA is relative to Textures\)
+TEXTURE_FIELDS = {
+    b"LTEX": (b"DATA",),          # Landscape texture
+    b"MGEF": (b"ITEX", b"PTEX"),  # Magic effect icon and particle texture
+    b"BSGN": (b"TNAM",),          # Birthsign image
+}
+
+# Records with an inventory icon (ICON, relative to Icons\)
+ICON_RECORDS = (b"ALCH", b"APPA", b"ARMO", b"BOOK", b"CLOT", b"INGR", b"LIGH", b"LOCK", b"MISC", b"PROB",
+                b"REPA", b"WEAP")
+
+READ_BUFFER = 1024 * 1024
+
+
+def iter_records(plugin_path, record_types=None):
+    """
+    Yields (record type, flags, data) for the records of a TES3 plugin, one at a time.
+
+    Records whose type isn't in record_types are skipped with a seek, so the bulk of a
+    master (CELL, LAND, NPC_ ...) is never read into memory.
+    """
+    with open(plugin_path, "rb", buffering=READ_BUFFER) as f:
+        first = True
+        while True:
+            header = f.read(RECORD_HEADER.size)
+            if not header:
+                return
+            if len(header) < RECORD_HEADER.size:
+                raise ValueError(f"{plugin_path}: truncated record header")
+            record_type, size, _, flags = RECORD_HEADER.unpack(header)
+            if first and record_type != b"TES3":
+                raise ValueError(f"{plugin_path} is not a TES3 plugin")
+            first = False
+
+            if record_types is not None and record_type not in record_types:
+                f.seek(size, os.SEEK_CUR)
+                continue
+            data = f.read(size)
+            if len(data) < size:
+                raise ValueError(f"{plugin_path}: truncated {record_type.decode('ascii', 'replace')} record")
+            yield record_type, flags, data
+
+
+def iter_subrecords(data):
+    """Yields (subrecord type, data) for the fields of one record."""
+    view = memoryview(data)
+    offset = 0
+    while offset + SUBRECORD_HEADER.size <= len(view):
+        sub_type, size = SUBRECORD_HEADER.unpack_from(view, offset)
+        offset += SUBRECORD_HEADER.size
+        yield sub_type, view[offset:offset + size]
+        offset += size
+
+
+def decode_zstring(data):
+    """Decodes a NUL-terminated Windows-1252 string field."""
+    return bytes(data).split(b"\0", 1)[0].decode("cp1252", errors="replace")
+
+
+def parse_texture_record(record_type, flags, data, include_icons):
+    """
+    Pulls the id and texture paths out of one record.
+
+    Returns:
+        (record id, list of lowercased paths, deleted flag).
+    """
+    fields = TEXTURE_FIELDS.get(record_type, ())
+    if include_icons:
+        fields += (b"ICON",)
+
+    record_id = None
+    paths = []
+    deleted = bool(flags & RECORD_DELETED)
+    for sub_type, sub_data in iter_subrecords(data):
+        if sub_type == b"NAME" and record_id is None:
+            record_id = decode_zstring(sub_data).lower()
+        elif sub_type == b"INDX" and record_type == b"MGEF":
+            record_id = int.from_bytes(sub_data, "little")  # Magic effects are identified by index
+        elif sub_type == b"DELE":
+            deleted = True
+        elif sub_type in fields:
+            path = decode_zstring(sub_data).strip().lower()
+            if path:
+                paths.append(path)
+    return record_id, paths, deleted
+
+
+def read_texture_paths(plugin_paths, include_icons=False, include_other=False):
+    """
+    Reads the texture paths referenced by plugins, applied in load order.
+
+    A record in a later plugin replaces the record with the same type and id from an
+    earlier one, and a deleted record removes it, so the result is what the game sees.
+
+    Args:
+        plugin_paths: .esm/.esp paths in load order (masters first).
+        include_icons: Also collect inventory icons (ICON) of item records.
+        include_other: Also collect magic effect (ITEX/PTEX) and birthsign (TNAM) textures.
+
+    Returns:
+        Dictionary of (record type, record id) -> list of lowercased paths.
+    """
+    record_types = {b"LTEX"}
+    if include_other:
+        record_types.update(TEXTURE_FIELDS)
+    if include_icons:
+        record_types.update(ICON_RECORDS)
+
+    textures = {}
+    for plugin_path in plugin_paths:
+        for record_type, flags, data in iter_records(plugin_path, record_types):
+            record_id, paths, deleted = parse_texture_record(record_type, flags, data, include_icons)
+            if record_id is None:
+                continue
+            key = (record_type.decode("ascii"), record_id)
+            if deleted:
+                textures.pop(key, None)
+            elif paths:
+                textures[key] = paths
+    return textures
+
+
+def get_texture_names(plugin_paths, include_icons=False, include_other=False):
+    """
+    Returns the sorted, unique file names (lowercased, folders dropped) of the textures
+    the plugins use, ready for diff.find_missing_alternatives.
+    """
+    textures = read_texture_paths(plugin_paths, include_icons, include_other)
+    return sorted({path.replace("/", "\\").rsplit("\\", 1)[-1] for paths in textures.values() for path in paths})
+
+
+def make_record(record_type, subrecords, flags=0):
+    """Builds the bytes of a record from (subrecord type, data) pairs."""
+    data = b"".join(SUBRECORD_HEADER.pack(sub_type, len(sub_data)) + sub_data for sub_type, sub_data in subrecords)
+    return RECORD_HEADER.pack(record_type, len(data), 0, flags) + data
+
+
+def write_synthetic_plugin(plugin_path, target_bytes, ltex_count=1000, filler_bytes=64 * 1024):
+    """
+    Writes a TES3 plugin of about target_bytes: a few LTEX records spread between large
+    LAND-sized filler records, like a master where landscape data dominates.
+
+    Returns:
+        The number of LTEX records written.
+    """
+    header = make_record(b"TES3", [(b"HEDR", struct.pack("<fI32s256sI", 1.3, 0, b"benchmark", b"", 0))])
+    filler = make_record(b"LAND", [(b"INTV", struct.pack("<ii", 0, 0)), (b"VHGT", bytes(filler_bytes))])
+    filler_count = max(1, (target_bytes - len(header)) // len(filler))
+    every = max(1, filler_count // ltex_count)
+
+    written = 0
+    with open(plugin_path, "wb", buffering=READ_BUFFER) as f:
+        f.write(header)
+        for index in range(filler_count):
+            f.write(filler)
+            if index % every == 0 and written < ltex_count:
+                f.write(make_record(b"LTEX", [
+                    (b"NAME", f"synthetic_{written}\0".encode("ascii")),
+                    (b"INTV", struct.pack("<I", written)),
+                    (b"DATA", f"tx_synthetic_{written}.dds\0".encode("ascii")),
+                ]))
+                written += 1
+    return written
+
+
+def run_benchmark(size_mb=256):
+    """Times read_texture_paths on a synthetic plugin of size_mb and reports throughput and peak memory."""
+    fd, plugin_path = tempfile.mkstemp(suffix=".esm")
+    os.close(fd)
+    try:
+        print(f"Writing a {size_mb} MB synthetic plugin to {plugin_path}...")
+        expected = write_synthetic_plugin(plugin_path, size_mb * 1024 * 1024)
+        file_size = os.path.getsize(plugin_path)
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        textures = read_texture_paths([plugin_path])
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"Found {len(textures)}/{expected} LTEX records in {file_size / (1024 * 1024):.0f} MB "
+              f"in {elapsed:.2f}s ({file_size / (1024 * 1024) / elapsed:.0f} MB/s), "
+              f"peak Python memory {peak / (1024 * 1024):.1f} MB.")
+    finally:
+        os.remove(plugin_path)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if args and args[0] == "--benchmark":
+        run_benchmark(int(args[1]) if len(args) > 1 else 256)
+    elif args:
+        include_icons = "--icons" in args
+        include_other = "--other" in args
+        plugins = [arg for arg in args if not arg.startswith("--")]
+        for name in get_texture_names(plugins, include_icons, include_other):
+            print(name)
+    else:
+        print("Usage: esmreader.py [--icons] [--other] Morrowind.esm [Tribunal.esm ...]")
+        print("       esmreader.py --benchmark [size in MB]")
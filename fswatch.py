@@ -0,0 +1,300 @@
+import os
+import sys
+import queue
+import select
+import struct
+import threading
+import ctypes
+import ctypes.util
+
+# Event kinds reported by FolderWatcher.get_events
+CREATED = "created"
+MODIFIED = "modified"
+DELETED = "deleted"
+RESCAN = "rescan"  # Events were lost (inotify queue overflow); the folder should be rescanned
+
+# Seconds between snapshots on the polling fallback; each one stats every file below the folders
+POLL_INTERVAL = 1.0
+
+# linux/inotify.h
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+
+def _load_inotify():
+    """Returns libc with the inotify calls set up, or None where inotify isn't available."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class FolderWatcher:
+    """
+    Reports files created, modified or deleted below a set of folders.
+
+    Uses inotify on Linux and falls back to comparing periodic scandir snapshots
+    (size, mtime) elsewhere. Events are collected on a background thread and
+    handed out as (kind, path) pairs, with paths joined onto the absolute folder
+    paths given to the constructor.
+    """
+
+    def __init__(self, folders, recursive=True, poll_interval=POLL_INTERVAL, use_inotify=True):
+        self.folders = [os.path.abspath(folder) for folder in folders]
+        self.recursive = recursive
+        self.poll_interval = poll_interval
+        self.events = queue.Queue()
+        self._stop = threading.Event()
+        self._watches = {}  # watch descriptor -> directory
+        self._fd = -1
+
+        self._libc = _load_inotify() if use_inotify else None
+        if self._libc is not None:
+            self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if self._fd < 0:
+                self._libc = None  # Out of inotify instances; poll instead
+
+        if self._libc is not None:
+            self.mode = "inotify"
+            for folder in self.folders:
+                self._add_tree(folder)
+            target = self._run_inotify
+        else:
+            self.mode = "polling"
+            self._snapshot = self._scan()
+            target = self._run_polling
+
+        self._thread = threading.Thread(target=target, daemon=True)
+        self._thread.start()
+
+    def get_events(self, timeout=None):
+        """Waits up to timeout seconds for a change, then returns every (kind, path) queued so far."""
+        try:
+            events = [self.events.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def close(self):
+        """Stops the background thread and releases the inotify descriptor."""
+        self._stop.set()
+        self._thread.join()
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _add_tree(self, folder, report=False):
+        """Watches a folder (and its subfolders when recursive); report=True queues the files found as created."""
+        stack = [folder]
+        while stack:
+            directory = stack.pop()
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                continue  # Gone already, or not readable
+            self._watches[wd] = directory
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if self.recursive:
+                                stack.append(entry.path)
+                        elif report and entry.is_file():
+                            self.events.put((CREATED, entry.path))
+            except OSError:
+                pass
+
+    def _run_inotify(self):
+        while not self._stop.is_set():
+            readable, _, _ = select.select([self._fd], [], [], 0.5)
+            if not readable:
+                continue
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                offset += length
+                self._handle_inotify_event(wd, mask, name)
+
+    def _handle_inotify_event(self, wd, mask, name):
+        if mask & IN_Q_OVERFLOW:
+            for folder in self.folders:
+                self.events.put((RESCAN, folder))
+            return
+        if mask & IN_IGNORED:
+            self._watches.pop(wd, None)  # The directory was removed
+            return
+
+        directory = self._watches.get(wd)
+        if directory is None or not name:
+            return
+        path = os.path.join(directory, name)
+
+        if mask & IN_ISDIR:
+            if mask & (IN_CREATE | IN_MOVED_TO):
+                if self.recursive:
+                    self._add_tree(path, report=True)  # Files may have landed before the watch did
+            elif mask & (IN_DELETE | IN_MOVED_FROM):
+                self.events.put((DELETED, path))
+            return
+
+        if mask & (IN_CREATE | IN_MOVED_TO):
+            self.events.put((CREATED, path))
+        elif mask & (IN_DELETE | IN_MOVED_FROM):
+            self.events.put((DELETED, path))
+        else:
+            self.events.put((MODIFIED, path))
+
+    def _scan(self):
+        """Returns path -> (size, mtime) for every file below the watched folders."""
+        snapshot = {}
+        stack = list(self.folders)
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if self.recursive:
+                                    stack.append(entry.path)
+                            elif entry.is_file():
+                                stat = entry.stat()
+                                snapshot[entry.path] = (stat.st_size, stat.st_mtime_ns)
+                        except OSError:
+                            pass  # Removed while scanning
+            except OSError:
+                pass
+        return snapshot
+
+    def _run_polling(self):
+        while not self._stop.wait(self.poll_interval):
+            snapshot = self._scan()
+            for path, state in snapshot.items():
+                previous = self._snapshot.get(path)
+                if previous is None:
+                    self.events.put((CREATED, path))
+                elif previous != state:
+                    self.events.put((MODIFIED, path))
+            for path in self._snapshot.keys() - snapshot.keys():
+                self.events.put((DELETED, path))
+            self._snapshot = snapshot
+
+
+class FileSet:
+    """
+    In-memory set of the files below a folder, kept current by a FolderWatcher.
+
+    Membership tests are set lookups on normalized absolute paths, so callers can ask
+    "does this file exist?" on the UI thread without a stat per question.
+    """
+
+    def __init__(self, folder, recursive=True, poll_interval=POLL_INTERVAL):
+        self.folder = os.path.abspath(folder)
+        self._paths = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+        # Watch first, then scan, so nothing created in between is missed
+        self._watcher = FolderWatcher([self.folder], recursive, poll_interval)
+        self._rescan()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def _key(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    def __contains__(self, path):
+        key = self._key(path)
+        with self._lock:
+            return key in self._paths
+
+    def __len__(self):
+        with self._lock:
+            return len(self._paths)
+
+    def add(self, path):
+        """
+        Records a file the caller just wrote.
+
+        The watcher only reports it after its next event read or poll (up to poll_interval
+        seconds on the polling fallback), so writers call this straight after writing to
+        make the file visible to membership tests right away.
+        """
+        key = self._key(path)
+        with self._lock:
+            self._paths.add(key)
+
+    def discard(self, path):
+        """Forgets a file the caller just removed."""
+        key = self._key(path)
+        with self._lock:
+            self._paths.discard(key)
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+        self._watcher.close()
+
+    def _rescan(self):
+        paths = set()
+        stack = [self.folder]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if self._watcher.recursive:
+                                stack.append(entry.path)
+                        elif entry.is_file():
+                            paths.add(self._key(entry.path))
+            except OSError:
+                pass
+        with self._lock:
+            self._paths = paths
+
+    def _run(self):
+        while not self._stop.is_set():
+            for kind, path in self._watcher.get_events(timeout=0.5):
+                if kind == RESCAN:
+                    self._rescan()
+                    continue
+                key = self._key(path)
+                with self._lock:
+                    if kind == DELETED and key in self._paths:
+                        self._paths.discard(key)
+                    elif kind == DELETED:
+                        # Not a known file, so a removed folder: drop everything below it
+                        prefix = os.path.join(key, "")
+                        self._paths = {p for p in self._paths if not p.startswith(prefix)}
+                    else:
+                        self._paths.add(key)
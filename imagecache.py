@@ -0,0 +1,78 @@
+import threading
+from collections import OrderedDict
+
+
+class LRUImageCache:
+    """
+    Thread-safe least-recently-used cache bounded by the total bytes of its values.
+
+    Callers supply each value's size when storing it, so the cache works for PIL
+    images, NumPy arrays or tuples containing them alike. Hits, misses and
+    evictions are counted for tuning max_bytes.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (value, nbytes)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Returns the cached value (marking it most recently used), or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value, nbytes):
+        """Stores a value, evicting the least recently used entries to stay within max_bytes."""
+        with self._lock:
+            if key in self._entries:
+                self.total_bytes -= self._entries.pop(key)[1]
+            if nbytes > self.max_bytes:
+                return  # Would evict everything else and still not fit
+            self._entries[key] = (value, nbytes)
+            self.total_bytes += nbytes
+            while self.total_bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted_bytes
+                self.evictions += 1
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self):
+        """Returns the hit/miss/eviction counters and current usage as a dictionary."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self.total_bytes,
+            }
+
+    def format_stats(self):
+        """Returns the stats as one line, e.g. for printing on exit."""
+        stats = self.stats()
+        return (f"{stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%} hit rate), "
+                f"{stats['evictions']} evictions, {stats['entries']} entries using {stats['bytes'] / (1024 * 1024):.0f} MB")
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
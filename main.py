@@ -17,6 +17,10 @@ from tkinter import font
 from tkinter import simpledialog, Toplevel
 from PIL import Image, ImageTk
 from urllib.parse import urlparse
+from mipmaps import generate_mipmaps, select_mip_level
+from catalog import get_catalog
+from fswatch import FileSet
+from imagecache import LRUImageCache
 
 # Enable DPI awareness
 try:
@@ -147,6 +151,29 @@ def fetch_api_data(url):
 
 THUMBNAIL_CACHE_DIR = "thumbnails"
 
+# Seconds between rescans of the watched folders where inotify isn't available (Windows).
+# Files the app writes are added to its FileSets directly, so polling only has to pick up
+# changes made by other tools, and each pass stats every file under the three folders.
+WATCH_POLL_INTERVAL = 5.0
+
+# Memory budget for the decoded full-resolution textures kept by display_texture
+IMAGE_CACHE_BYTES = 512 * 1024 * 1024
+# Separate budget for prepared thumbnail tiles (640 KB each), so browsing matches
+# never pushes the textures above out of their cache
+THUMB_TILE_CACHE_BYTES = 64 * 1024 * 1024
+
+# Zoom preview: source box shown at preview size, and at most one render per frame
+ZOOM_BOX_SIZE = 200
+ZOOM_PREVIEW_SIZE = 300
+ZOOM_FRAME_MS = 16
+
+# Thumbnail grid: image area and fixed outer size of a tile, and the gap between tiles
+THUMB_TILE_SIZE = 400
+THUMB_TILE_WIDTH = 420
+THUMB_TILE_HEIGHT = 500
+THUMB_TILE_PADDING = 8
+THUMB_ROW_HEIGHT = THUMB_TILE_HEIGHT + THUMB_TILE_PADDING
+
 def ensure_thumbnail_cache_dir():
     if not os.path.exists(THUMBNAIL_CACHE_DIR):
         os.makedirs(THUMBNAIL_CACHE_DIR)
@@ -158,7 +185,8 @@ def get_cached_thumbnail_path(thumbnail_url):
     filename = os.path.basename(parsed_url.path)  # Extract the filename without query parameters
     return os.path.join(THUMBNAIL_CACHE_DIR, filename)
 
-def fetch_thumbnail(thumbnail_url):
+def fetch_thumbnail(thumbnail_url, file_set=None):
+    """Returns a thumbnail from the cache folder, downloading it first if needed; new downloads are added to file_set."""
     cache_path = get_cached_thumbnail_path(thumbnail_url)
     if os.path.exists(cache_path):
         return Image.open(cache_path)  # Load from cache
@@ -169,6 +197,8 @@ def fetch_thumbnail(thumbnail_url):
             with open(cache_path, "wb") as f:
                 for chunk in response.iter_content(1024):  # Save in chunks
                     f.write(chunk)
+            if file_set is not None:
+                file_set.add(cache_path)
             return Image.open(cache_path)
         else:
             print(f"Failed to fetch thumbnail. Status code: {response.status_code}")
@@ -186,6 +216,27 @@ class TextureTagger:
         self.root = root
         self.root.title("Morrowind PBR Texture Project")
         self.db = db
+
+        # Files whose existence the UI checks on every texture, kept in memory by folder watchers
+        for folder in (TARGET_FOLDER, OVERLAY_FOLDER, THUMBNAIL_CACHE_DIR):
+            os.makedirs(folder, exist_ok=True)
+        self.staged_files = FileSet(TARGET_FOLDER, poll_interval=WATCH_POLL_INTERVAL)
+        self.overlay_files = FileSet(OVERLAY_FOLDER, poll_interval=WATCH_POLL_INTERVAL)
+        self.thumbnail_files = FileSet(THUMBNAIL_CACHE_DIR, poll_interval=WATCH_POLL_INTERVAL)
+
+        # Decoded RGBA arrays keyed by (path, mtime_ns), shared by the view, zoom and overlay compositing
+        self.image_cache = LRUImageCache(IMAGE_CACHE_BYTES)
+        # Thumbnail tiles keyed by URL, on their own budget
+        self.thumbnail_tile_cache = LRUImageCache(THUMB_TILE_CACHE_BYTES)
+        # Reused by combine_overlay; only reallocated when the texture size changes
+        self.composite_buffer = None
+        self.full_res_array = None
+
+        # Zoom preview state: latest mouse position, pending render, reused PhotoImage
+        self.zoom_event = None
+        self.zoom_job = None
+        self.zoom_photo = None
+
         self.texture_paths = self.get_texture_paths()
         self.filtered_texture_paths = self.texture_paths  # For filtering purposes
         
@@ -426,6 +477,22 @@ class TextureTagger:
         self.thumbnail_frame.pack(pady=10)
         self.thumbnail_frame.pack_propagate(False)
 
+        # Scrollable thumbnail grid: a small pool of tiles is moved and rebound as the canvas scrolls
+        self.thumbnail_matches = []
+        self.thumbnail_tiles = []
+        self.thumbnail_scrollbar = tk.Scrollbar(self.thumbnail_frame, orient="vertical")
+        self.thumbnail_scrollbar.pack(side="right", fill="y")
+        self.thumbnail_canvas = tk.Canvas(self.thumbnail_frame, bg="black", highlightthickness=0,
+                                          yscrollincrement=THUMB_ROW_HEIGHT // 4,
+                                          yscrollcommand=self.on_thumbnail_scroll)
+        self.thumbnail_canvas.pack(side="left", fill="both", expand=True)
+        self.thumbnail_scrollbar.config(command=self.thumbnail_canvas.yview)
+        self.thumbnail_message = self.thumbnail_canvas.create_text(
+            10, 10, anchor="nw", fill="white", state="hidden",
+            text="No matching thumbnails found.", font=("Arial", int(12 * scale_factor)))
+        self.thumbnail_canvas.bind("<Configure>", lambda event: self.update_thumbnail_tiles())
+        self.bind_thumbnail_wheel(self.thumbnail_canvas)
+
         # Add togglable buttons with labels
         self.button_info = {
             "tx_a_": "armor",
@@ -618,12 +685,14 @@ class TextureTagger:
             #print(f"No matching texture found for {full_path}. Current index set to -1.")
 
     def get_texture_paths(self):
-        paths = []
-        for root, _, files in os.walk("textures"):
-            for file in files:
-                if file.lower().endswith(("png", "jpg", "jpeg")):
-                    paths.append(os.path.join(root, file))
-        return paths
+        """Returns the source textures as "textures\\..." paths, from the asset catalog."""
+        catalog = get_catalog()
+        catalog.refresh("textures")
+        textures_root = os.path.abspath("textures")
+        return [
+            os.path.join("textures", os.path.relpath(entry.path, textures_root))
+            for entry in catalog.files("textures", extensions=("png", "jpg", "jpeg"))
+        ]
 
     def get_current_index(self):
         for i, path in enumerate(self.filtered_texture_paths):
@@ -639,7 +708,7 @@ class TextureTagger:
         #print("JOIN2: ", file_path)
 
         # Check if the file exists and update the background color
-        if os.path.isfile(file_path):
+        if file_path in self.staged_files:
             self.texture_name_label.config(bg="green")  # Set background to green
         else:
             self.texture_name_label.config(bg=self.default_bg)  # Reset background to default (None)
@@ -1028,7 +1097,7 @@ class TextureTagger:
                 #print(f"Slot: {self.selected_slot}, Thumbnail path: {thumbnail_path}")
 
                 # Load and display the thumbnail
-                if os.path.exists(thumbnail_path):
+                if thumbnail_path in self.thumbnail_files:
                     try:
                         image = Image.open(thumbnail_path)
 
@@ -1064,109 +1133,165 @@ class TextureTagger:
 
     def display_thumbnails(self):
         """Display selectable thumbnails of textures from Polyhaven."""
-        #start_time = time.time()
-        #print("Starting display_thumbnails...")
-
-        # Clear previous thumbnails
-        for widget in self.thumbnail_frame.winfo_children():
-            widget.destroy()
-        #print(f"Time to clear thumbnails: {time.time() - start_time:.4f} seconds")
-
-        # Get matching textures for the current texture
-        matching_textures = self.get_matching_textures()
-
-        # Paginate the thumbnails (show 5 at a time)
-        start_index = self.current_thumbnail_index
-        end_index = start_index + 5
-        paginated_textures = matching_textures[start_index:end_index]
-        #print(json.dumps(matching_textures, indent=4))
-
-        if not paginated_textures:
-            no_results_label = Label(self.thumbnail_frame, text="No matching thumbnails found.", font=("Arial", int(12 * scale_factor)))
-            no_results_label.pack(pady=10)
-            self.update_selected_thumbnails_count()
+        # Get matching textures for the current texture and size the scroll area for all of them
+        self.thumbnail_matches = self.get_matching_textures()
+        total_height = len(self.thumbnail_matches) * THUMB_ROW_HEIGHT + THUMB_TILE_PADDING
+        self.thumbnail_canvas.config(scrollregion=(0, 0, THUMB_TILE_WIDTH, total_height))
+        self.thumbnail_canvas.yview_moveto(0)
+
+        state = "hidden" if self.thumbnail_matches else "normal"
+        self.thumbnail_canvas.itemconfigure(self.thumbnail_message, state=state)
+
+        self.update_thumbnail_tiles()
+        # Update the selected thumbnails count
+        self.update_selected_thumbnails_count()
+
+    def create_thumbnail_tile(self):
+        """Creates one pooled tile (container, image and tags) on the thumbnail canvas."""
+        container = Frame(
+            self.thumbnail_canvas,
+            width=THUMB_TILE_WIDTH,
+            height=THUMB_TILE_HEIGHT,
+            borderwidth=2,
+            relief="solid",
+            highlightbackground="gray",
+            highlightthickness=2,
+            bg="black"
+        )
+        container.pack_propagate(False)  # Every tile is the same size, so rows can be positioned arithmetically
+
+        # The tile keeps one PhotoImage for its lifetime; rebinding pastes into it
+        photo = ImageTk.PhotoImage("RGBA", (THUMB_TILE_SIZE, THUMB_TILE_SIZE))
+        thumb_label = Label(container, image=photo, width=THUMB_TILE_SIZE, height=THUMB_TILE_SIZE, bg="black")
+        thumb_label.pack(pady=5)
+
+        tags_label = Label(
+            container,
+            wraplength=250,  # Ensure text wraps within the container
+            font=("Arial", int(8)),
+            justify="center",
+            height=4
+        )
+        tags_label.pack(pady=5)
+
+        tile = {
+            "container": container,
+            "photo": photo,
+            "tags_label": tags_label,
+            "window": self.thumbnail_canvas.create_window(THUMB_TILE_PADDING, 0, window=container, anchor="nw"),
+            "index": None,
+            "texture_id": None,
+            "thumbnail_url": None,
+        }
+
+        # Handle click to select/unselect whichever texture the tile currently shows
+        def on_click(event=None):
+            if tile["texture_id"] is not None:
+                self.toggle_selection(tile["texture_id"], container)
+                self.update_selected_thumbnails_count()
+
+        for widget in (container, thumb_label, tags_label):
+            widget.bind("<Button-1>", on_click)
+            self.bind_thumbnail_wheel(widget)
+        return tile
+
+    def get_thumbnail_tile_image(self, thumbnail_url):
+        """Returns a thumbnail scaled and centred on a tile-sized image, cached so scrolling back is free."""
+        tile_image = self.thumbnail_tile_cache.get(thumbnail_url)
+        if tile_image is not None:
+            return tile_image
+
+        # Fetch the thumbnail (use caching)
+        thumb_img = fetch_thumbnail(thumbnail_url, self.thumbnail_files)
+        if thumb_img is None:
+            return None
+        thumb_img.thumbnail((512, 512))  # Adjust thumbnail size for display
+
+        # Scale by 1.5x
+        width, height = thumb_img.size
+        thumb_resized = thumb_img.resize((int(width * 1.5), int(height * 1.5)), Image.Resampling.LANCZOS)
+
+        # Centre it in the image area like a Label would, cropping what overflows
+        tile_image = Image.new("RGBA", (THUMB_TILE_SIZE, THUMB_TILE_SIZE), "black")
+        tile_image.paste(thumb_resized.convert("RGBA"),
+                         ((THUMB_TILE_SIZE - thumb_resized.width) // 2, (THUMB_TILE_SIZE - thumb_resized.height) // 2))
+        self.thumbnail_tile_cache.put(thumbnail_url, tile_image, THUMB_TILE_SIZE * THUMB_TILE_SIZE * 4)
+        return tile_image
+
+    def bind_thumbnail_tile(self, tile, texture):
+        """Points a pooled tile at a matching texture, repainting only if it shows a different one."""
+        texture_id = texture.get("name")  # Unique ID for the texture
+        thumbnail_url = texture.get("thumbnail_url")
+        if tile["texture_id"] == texture_id and tile["thumbnail_url"] == thumbnail_url:
             return
 
-        # Display thumbnails and tags for each matching texture
-        for col, texture in enumerate(paginated_textures):
-            thumbnail_url = texture.get("thumbnail_url")
-            texture_id = texture.get("name")  # Unique ID for the texture
-            
-            texture_tags = texture.get("tags", [])
+        tile["texture_id"] = texture_id
+        tile["thumbnail_url"] = thumbnail_url
+        tile["tags_label"].config(text=", ".join(texture.get("tags", [])))
 
-            if thumbnail_url:
-                try:
-                    # Fetch the thumbnail (use caching)
-                    thumb_img = fetch_thumbnail(thumbnail_url)
-                    if thumb_img:
-                        thumb_img.thumbnail((512, 512))  # Adjust thumbnail size for display
+        tile_image = None
+        if thumbnail_url:
+            try:
+                tile_image = self.get_thumbnail_tile_image(thumbnail_url)
+            except Exception as e:
+                print(f"Error loading thumbnail from {thumbnail_url}: {e}")
+        if tile_image is None:
+            tile_image = Image.new("RGBA", (THUMB_TILE_SIZE, THUMB_TILE_SIZE), "black")
+        tile["photo"].paste(tile_image)
+
+    def update_thumbnail_tiles(self):
+        """Places and rebinds the pooled tiles for the rows inside the visible part of the thumbnail canvas."""
+        top = max(0, int(self.thumbnail_canvas.canvasy(0)))
+        view_height = self.thumbnail_canvas.winfo_height()
+        first_row = top // THUMB_ROW_HEIGHT
+        last_row = min(len(self.thumbnail_matches), (top + view_height) // THUMB_ROW_HEIGHT + 1)
+        self.current_thumbnail_index = first_row
+
+        # The pool only grows to the number of rows that fit on screen at once
+        while len(self.thumbnail_tiles) < last_row - first_row:
+            self.thumbnail_tiles.append(self.create_thumbnail_tile())
+
+        texture_path = self.filtered_texture_paths[self.current_index] if self.filtered_texture_paths else None
+        selected_thumbnails = self.db["textures"].get(texture_path, {}).get("selected_thumbnails", [])
 
-                        # Get current dimensions
-                        width, height = thumb_img.size
+        # Row i always uses tile i % pool size, so scrolling by a row rebinds a single tile
+        visible = set()
+        if self.thumbnail_tiles:
+            for index in range(first_row, last_row):
+                tile = self.thumbnail_tiles[index % len(self.thumbnail_tiles)]
+                visible.add(id(tile))
+                self.bind_thumbnail_tile(tile, self.thumbnail_matches[index])
+
+                # Highlight if already selected
+                color = "blue" if tile["texture_id"] in selected_thumbnails else "gray"
+                tile["container"].config(highlightbackground=color)
+                if tile["index"] != index:
+                    tile["index"] = index
+                    self.thumbnail_canvas.coords(tile["window"], THUMB_TILE_PADDING,
+                                                 index * THUMB_ROW_HEIGHT + THUMB_TILE_PADDING)
+                self.thumbnail_canvas.itemconfigure(tile["window"], state="normal")
+
+        for tile in self.thumbnail_tiles:
+            if id(tile) not in visible:
+                tile["index"] = None
+                self.thumbnail_canvas.itemconfigure(tile["window"], state="hidden")
 
-                        # Scale by 1.5x
-                        new_width = int(width * 1.5)
-                        new_height = int(height * 1.5)
+        self.update_pagination()
 
-                        # Resize the image
-                        thumb_resized = thumb_img.resize((new_width, new_height), Image.Resampling.LANCZOS)  # Resizes with high-quality filtering
-
-                        thumb_photo = ImageTk.PhotoImage(thumb_resized)
-
-                        # Create a fixed-size container for thumbnail and tags
-                        thumb_container = Frame(
-                            self.thumbnail_frame,
-                            borderwidth=2,
-                            relief="solid",
-                            highlightbackground="gray",
-                            highlightthickness=2,
-                            bg="black"
-                        )
-                        
-                        thumb_container.grid(row=0, column=col, padx=10, pady=5, sticky="N")
-                        thumb_container.grid_propagate(False)  # Prevent resizing
-
-                        # Display the thumbnail image
-                        thumb_label = Label(thumb_container, image=thumb_photo, width=400, height=400, bg="black")
-                        thumb_label.image = thumb_photo  # Keep reference to prevent garbage collection
-                        thumb_label.pack(pady=5)
-                      
-
-                        # Display texture tags
-                        tags_label = Label(
-                            thumb_container,
-                            text=", ".join(texture_tags),
-                            wraplength=250,  # Ensure text wraps within the container
-                            font=("Arial", int(8)),
-                            justify="center",
-                            height=4
-                        )
-                        thumb_label.pack(fill=None, expand=False)
-                        tags_label.pack(pady=5)
-
-                        # Handle click to select/unselect thumbnail
-                        def on_click(event=None, texture_id=texture_id, container=thumb_container):
-                            self.toggle_selection(texture_id, container)
-                            self.update_selected_thumbnails_count()
-
-                        # Bind click event to the entire container
-                        thumb_container.bind("<Button-1>", on_click)
-                        thumb_label.bind("<Button-1>", on_click)
-                        tags_label.bind("<Button-1>", on_click)
-
-                        # Highlight if already selected
-                        texture_path = self.filtered_texture_paths[self.current_index]
-                        selected_thumbnails = self.db["textures"].get(texture_path, {}).get("selected_thumbnails", [])
-                        #print(f"Current Texture Path: {texture_path}")
-                        #print(f"Selected Thumbnails: {selected_thumbnails}")
-                        #print(f"Checking Texture ID: {texture_id}")
-                        if texture_id in selected_thumbnails:
-                            thumb_container.config(highlightbackground="blue", highlightthickness=2)
-
-                except Exception as e:
-                    print(f"Error loading thumbnail from {thumbnail_url}: {e}")
-        # Update the selected thumbnails count
-        self.update_selected_thumbnails_count()
+    def on_thumbnail_scroll(self, first, last):
+        """Keeps the scrollbar in step with the thumbnail canvas and rebinds tiles for the new view."""
+        self.thumbnail_scrollbar.set(first, last)
+        self.update_thumbnail_tiles()
+
+    def bind_thumbnail_wheel(self, widget):
+        """Scrolls the thumbnail canvas with the mouse wheel over a widget (Windows delta or X11 buttons 4/5)."""
+        def on_wheel(event):
+            down = getattr(event, "num", None) == 5 or getattr(event, "delta", 0) < 0
+            self.thumbnail_canvas.yview_scroll(1 if down else -1, "units")
+
+        widget.bind("<MouseWheel>", on_wheel)
+        widget.bind("<Button-4>", on_wheel)
+        widget.bind("<Button-5>", on_wheel)
 
     def toggle_selection(self, texture_id, container):
         """Toggle selection of a thumbnail for the current texture and update the database."""
@@ -1191,34 +1316,22 @@ class TextureTagger:
         self.update_counts()
 
     def next_thumbnails(self):
-        # Update the index and display thumbnails
-        total_thumbnails = len(self.get_matching_textures())
-        self.current_thumbnail_index = min(self.current_thumbnail_index + 5, total_thumbnails - 1)
-
-         # Calculate the current page and total pages
-        thumbnails_per_page = 5
-        current_page = (self.current_thumbnail_index // thumbnails_per_page) + 1
-        total_pages = (total_thumbnails // thumbnails_per_page) + (1 if total_thumbnails % thumbnails_per_page > 0 else 0)
-        
-        # Update the page indicator
-        self.page_indicator.config(text=f"{current_page}/{total_pages}")
-        
-        self.display_thumbnails()
+        """Scroll the thumbnail grid down by one tile."""
+        self.scroll_thumbnails_to(self.current_thumbnail_index + 1)
 
     def previous_thumbnails(self):
-        """Show the next set of thumbnails."""
-        total_thumbnails = len(self.get_matching_textures())
-        self.current_thumbnail_index = max(self.current_thumbnail_index - 5, 0)
-
-        # Calculate the current page and total pages
-        thumbnails_per_page = 5
-        current_page = (self.current_thumbnail_index // thumbnails_per_page) + 1
-        total_pages = (total_thumbnails // thumbnails_per_page) + (1 if total_thumbnails % thumbnails_per_page > 0 else 0)
-        
-        # Update the page indicator
-        self.page_indicator.config(text=f"{current_page}/{total_pages}")
-    
-        self.display_thumbnails()
+        """Scroll the thumbnail grid up by one tile."""
+        self.scroll_thumbnails_to(self.current_thumbnail_index - 1)
+
+    def scroll_thumbnails_to(self, index):
+        """Scroll so the tile at index is at the top of the thumbnail grid."""
+        total_thumbnails = len(self.thumbnail_matches)
+        if total_thumbnails == 0:
+            return
+        index = max(0, min(index, total_thumbnails - 1))
+        total_height = total_thumbnails * THUMB_ROW_HEIGHT + THUMB_TILE_PADDING
+        self.thumbnail_canvas.yview_moveto(index * THUMB_ROW_HEIGHT / total_height)
+        self.update_thumbnail_tiles()
 
 
     def display_texture(self, entered_texture_name=None):
@@ -1282,9 +1395,9 @@ class TextureTagger:
 
             # Check for existence of overlay images
             overlay_path = None
-            if os.path.exists(diff_overlay_path):
+            if diff_overlay_path in self.overlay_files:
                 overlay_path = diff_overlay_path
-            elif os.path.exists(col_overlay_path):
+            elif col_overlay_path in self.overlay_files:
                 overlay_path = col_overlay_path
 
             if overlay_path is None:
@@ -1303,7 +1416,7 @@ class TextureTagger:
         if overlay_path:
             overlay_image = self.load_image(overlay_path)
             if overlay_image is not None:
-                # Combine the overlay with the zoom image (as the base)
+                # Combine the overlay with the zoom image (as the base) in the reusable buffer
                 image = self.combine_overlay(zoom_image, overlay_image)
             else:
                 print(f"Failed to load overlay image: {overlay_path}")
@@ -1313,7 +1426,7 @@ class TextureTagger:
 
         # Prepare the resized version (for display)
         display_image = self.prepare_display_image(image)
-        self.full_res_image = Image.fromarray(image)
+        self.full_res_array = image  # Zoom previews slice this array rather than copying it
         # Save the display size for zoom preview calculations
         self.display_image_size = display_image.size
 
@@ -1335,9 +1448,21 @@ class TextureTagger:
         # Display thumbnails of related textures
         self.display_thumbnails()
 
+    def get_image_key(self, image_path):
+        """Returns the (path, mtime_ns) cache key of a file, or None if it doesn't exist."""
+        try:
+            return os.path.normcase(os.path.abspath(image_path)), os.stat(image_path).st_mtime_ns
+        except OSError:
+            return None
+
     def load_image(self, image_path):
-        """Load and process an image if it exists."""
-        if os.path.isfile(image_path):
+        """Load and process an image if it exists, reusing the decoded array while the file is unchanged."""
+        key = self.get_image_key(image_path)
+        if key is not None:
+            image = self.image_cache.get(key)
+            if image is not None:
+                return image
+
             image = cv2.imread(image_path, cv2.IMREAD_UNCHANGED)
             if image is None:
                 print(f"Failed to load image: {image_path}")
@@ -1355,13 +1480,18 @@ class TextureTagger:
             elif image.shape[2] == 4:  # BGRA
                 image = cv2.cvtColor(image, cv2.COLOR_BGRA2RGBA)
 
+            image.flags.writeable = False  # Shared with the view and zoom; never modified in place
+            self.image_cache.put(key, image, image.nbytes)
             return image
         return None
 
     def combine_overlay(self, base_image, overlay_image):
-        """Combine overlay image with the base image (zoom image)."""
-        combined_image = np.copy(base_image)  # Start with the base image (zoom image)
+        """Combine overlay image with the base image (zoom image) into the reusable composite buffer."""
+        combined_image = self.composite_buffer
+        if combined_image is None or combined_image.shape != base_image.shape or combined_image.dtype != base_image.dtype:
+            combined_image = self.composite_buffer = np.empty_like(base_image)
         overlay_y_offset = base_image.shape[0] // 2  # Overlay at 50% vertical position
+        combined_image[:overlay_y_offset, :, :] = base_image[:overlay_y_offset, :, :]
         combined_image[overlay_y_offset:, :, :] = overlay_image[overlay_y_offset:, :, :]
         return combined_image
 
@@ -1376,8 +1506,25 @@ class TextureTagger:
         return Image.fromarray(display_image)
 
     def show_zoom_preview(self, event):
+        """Queues a zoom preview update for the mouse position; renders are coalesced to one per frame."""
+        self.zoom_event = (event.x, event.y, event.x_root, event.y_root)
+        if self.zoom_job is None:
+            self.zoom_job = self.root.after(ZOOM_FRAME_MS, self.render_zoom_preview)
+
+    def get_zoom_box(self, left, upper, right, lower):
+        """Returns the preview of a box of the full-res image, resampling only the pixels under the cursor."""
+        # Resize the zoom box for display; the slice is a view, only the small box is copied
+        zoom_box = Image.fromarray(np.ascontiguousarray(self.full_res_array[upper:lower, left:right]))
+        return zoom_box.resize((ZOOM_PREVIEW_SIZE, ZOOM_PREVIEW_SIZE), Image.LANCZOS)  # High-quality scaling
+
+    def render_zoom_preview(self):
         """Show a zoomed-in preview of the image where the mouse hovers."""
-        if not hasattr(self, "full_res_image") or not self.full_res_image:
+        self.zoom_job = None
+        if self.zoom_event is None:
+            return
+        x, y, x_root, y_root = self.zoom_event
+
+        if self.full_res_array is None:
             return
 
         # Ensure display size is set
@@ -1385,20 +1532,18 @@ class TextureTagger:
             print("Display image size not set.")
             return
 
-        # Calculate the mouse position relative to the display image
         # Calculate the mouse position relative to the display image
         display_width, display_height = self.display_image_size
-        full_width, full_height = self.full_res_image.size
+        full_height, full_width = self.full_res_array.shape[:2]
         x_ratio = full_width / display_width
         y_ratio = full_height / display_height
 
         # Determine the corresponding coordinates in the full-resolution image
-        full_x = int(event.x * x_ratio)
-        full_y = int(event.y * y_ratio)
+        full_x = int(x * x_ratio)
+        full_y = int(y * y_ratio)
 
         # Define the size of the zoom preview box
-        zoom_box_size = 200  # Fixed size for consistent zoom
-        half_box_size = zoom_box_size // 2
+        half_box_size = ZOOM_BOX_SIZE // 2
 
         # Adjust to keep the zoom box inside the image boundaries
         left = full_x - half_box_size
@@ -1421,23 +1566,23 @@ class TextureTagger:
             upper -= (lower - full_height)
             lower = full_height
 
-        # Crop the zoom box from the full-resolution image
-        zoom_box = self.full_res_image.crop((left, upper, right, lower))
-
-        # Resize the zoom box for display
-        zoom_box = zoom_box.resize((300, 300), Image.LANCZOS)  # High-quality scaling
-        zoom_photo = ImageTk.PhotoImage(zoom_box)
+        zoom_box = self.get_zoom_box(max(left, 0), max(upper, 0), right, lower)
 
-        # Create a label to show the zoom preview
+        # Create the label and its image once; later frames paste into the same PhotoImage
+        if self.zoom_photo is None:
+            self.zoom_photo = ImageTk.PhotoImage("RGBA", (ZOOM_PREVIEW_SIZE, ZOOM_PREVIEW_SIZE))
         if not hasattr(self, "zoom_label"):
-            self.zoom_label = tk.Label(self.root, bg="white", bd=1, relief="solid")
+            self.zoom_label = tk.Label(self.root, bg="white", bd=1, relief="solid", image=self.zoom_photo)
 
-        self.zoom_label.config(image=zoom_photo)
-        self.zoom_label.image = zoom_photo
-        self.zoom_label.place(x=event.x_root + 10, y=event.y_root + 10)
+        self.zoom_photo.paste(zoom_box.convert("RGBA") if zoom_box.mode != "RGBA" else zoom_box)
+        self.zoom_label.place(x=x_root + 10, y=y_root + 10)
 
     def hide_zoom_preview(self, event):
         """Hide the zoom preview when the mouse leaves the image."""
+        self.zoom_event = None
+        if self.zoom_job is not None:
+            self.root.after_cancel(self.zoom_job)
+            self.zoom_job = None
         if hasattr(self, "zoom_label"):
             self.zoom_label.place_forget()
 
@@ -1506,16 +1651,12 @@ class TextureTagger:
         self.update_pagination()
 
     def update_pagination(self):
-        # Get the total number of thumbnails and calculate the total pages
-        total_thumbnails = len(self.get_matching_textures())
-        thumbnails_per_page = 5
-        total_pages = (total_thumbnails // thumbnails_per_page) + (1 if total_thumbnails % thumbnails_per_page > 0 else 0)
-        
-        # Calculate the current page
-        current_page = (self.current_thumbnail_index // thumbnails_per_page) + 1
-        
-        # Update the page indicator label
-        self.page_indicator.config(text=f"{current_page}/{total_pages}")
+        """Show the position of the top visible thumbnail out of all matches."""
+        if not hasattr(self, "page_indicator"):
+            return  # The first texture is displayed before the thumbnail buttons are built
+        total_thumbnails = len(self.thumbnail_matches)
+        current = min(self.current_thumbnail_index + 1, total_thumbnails)
+        self.page_indicator.config(text=f"{current}/{total_thumbnails}")
 
     def apply_filters(self):
         """Apply filters based on active buttons and config type"""
@@ -2037,10 +2178,14 @@ class TextureTagger:
             return None
 
         # Helper function to find a file
+        catalog = get_catalog()
+        catalog.refresh(staging_dir, recursive=False)
+        staging_names = [entry.name for entry in catalog.files(staging_dir, recursive=False)]
+
         def find_file(substrings, down_thumbnail_name):
             if isinstance(substrings, str):
                 substrings = [substrings]
-            for filename in os.listdir(staging_dir):
+            for filename in staging_names:
                 filename_casefold = filename.casefold()
                 if filename_casefold.startswith(down_thumbnail_name):
                     for substring in substrings:
@@ -2077,6 +2222,7 @@ class TextureTagger:
         param_texture = cv2.merge([param_b, param_g, param_r, param_a])
         param_output_path = os.path.join(staging_dir, f"{texture_name_label}_param.png")
         cv2.imwrite(param_output_path, param_texture)
+        self.staged_files.add(param_output_path)
         print(f"Saved param texture: {param_output_path}")
 
     def create_nh_texture(self, texture_name_label, staging_dir, nor_texture, disp_texture):
@@ -2092,6 +2238,7 @@ class TextureTagger:
         nh_texture = cv2.merge([nh_blue, nh_green, nh_red, nh_alpha])
         nh_output_path = os.path.join(staging_dir, f"{texture_name_label}_nh.png")
         cv2.imwrite(nh_output_path, nh_texture)
+        self.staged_files.add(nh_output_path)
         print(f"Saved nh texture: {nh_output_path}")
 
     def process_and_save_diff_textures(self, texture_name_label, down_thumbnail_name, staging_dir, diff_texture, arm_texture):
@@ -2120,6 +2267,7 @@ class TextureTagger:
         # Save the diffuse texture
         diff_output_path = os.path.join(staging_dir, f"{texture_name_label}.png")
         cv2.imwrite(diff_output_path, diff_texture_8bit)
+        self.staged_files.add(diff_output_path)
         print(f"Saved diffuse texture: {diff_output_path}")
 
         # Path to the results file (assumes it's in the current working directory)
@@ -2139,13 +2287,17 @@ class TextureTagger:
         target_size = (results_image.shape[1], results_image.shape[0])  # (width, height)
         print(f"Retrieved target size from results file: {target_size}")
 
-        # Save the overlay texture (resized)
-        overlay_texture = cv2.resize(diff_texture_8bit, target_size, interpolation=cv2.INTER_LINEAR)
+        # Save the overlay texture (resized): reduce through a gamma-correct mip chain first,
+        # then area-resample the closest level so large sources don't alias
+        overlay_levels = generate_mipmaps(diff_texture_8bit, srgb=True, min_size=target_size)
+        overlay_level = select_mip_level(overlay_levels, *target_size)
+        overlay_texture = cv2.resize(overlay_level, target_size, interpolation=cv2.INTER_AREA)
         #overlay_name_path = os.path.basename(texture_name_label)
         
         overlay_output_path = os.path.join(OVERLAY_FOLDER, f"{down_thumbnail_name}_overlay.png")
         #print("overlay_output_path", overlay_output_path)
         cv2.imwrite(overlay_output_path, overlay_texture)
+        self.overlay_files.add(overlay_output_path)
         print(f"Saved overlay texture: {overlay_output_path}")
 
         # If arm_texture is provided, create and save the diffparam texture
@@ -2157,6 +2309,7 @@ class TextureTagger:
             diffparam_texture = cv2.merge([d_red, d_green, d_blue, d_alpha])
             diffparam_output_path = os.path.join(staging_dir, f"{texture_name_label}_diffparam.png")
             cv2.imwrite(diffparam_output_path, diffparam_texture)
+            self.staged_files.add(diffparam_output_path)
             print(f"Saved diffparam texture: {diffparam_output_path}")
 
 
@@ -2167,4 +2320,6 @@ if __name__ == "__main__":
     root = Tk()
     app = TextureTagger(root, db)
     root.mainloop()
+    print(f"Image cache: {app.image_cache.format_stats()}")
+    print(f"Thumbnail tile cache: {app.thumbnail_tile_cache.format_stats()}")
 
@@ -0,0 +1,193 @@
+import numpy as np
+
+# Kaiser window parameters (same defaults as the NVIDIA texture tools)
+KAISER_WIDTH = 3.0
+KAISER_ALPHA = 4.0
+
+
+def srgb_to_linear(values):
+    """Converts sRGB encoded values in [0, 1] to linear light."""
+    return np.where(values <= 0.04045, values / 12.92, ((values + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(values):
+    """Converts linear light values in [0, 1] to sRGB encoding."""
+    values = np.clip(values, 0.0, 1.0)
+    return np.where(values <= 0.0031308, values * 12.92, 1.055 * np.power(values, 1 / 2.4) - 0.055)
+
+
+def get_mip_size(width, height, level):
+    """Returns the (width, height) of a mip level, following the D3D floor rule."""
+    return max(1, width >> level), max(1, height >> level)
+
+
+def _to_float(image):
+    """Converts an integer image to float32 in [0, 1]."""
+    if image.dtype == np.uint8:
+        return image.astype(np.float32) / 255.0
+    if image.dtype == np.uint16:
+        return image.astype(np.float32) / 65535.0
+    return image.astype(np.float32)
+
+
+def _from_float(image, dtype):
+    """Converts a float32 image in [0, 1] back to the original dtype."""
+    if dtype == np.uint8:
+        return (np.clip(image, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8)
+    if dtype == np.uint16:
+        return (np.clip(image, 0.0, 1.0) * 65535.0 + 0.5).astype(np.uint16)
+    return image.astype(dtype)
+
+
+def _axis_weights(src, dst, kind, wrap):
+    """
+    Builds the gather indices and weights that reduce an axis of length src to dst.
+
+    Returns:
+        tuple: (indices, weights), both shaped (dst, taps).
+    """
+    scale = src / dst
+    centers = (np.arange(dst) + 0.5) * scale  # Output texel centers in input coordinates
+
+    if kind == "box":
+        # Exact area coverage of each input texel by the output footprint
+        taps = int(np.ceil(scale)) + 1
+        starts = np.floor(centers - scale / 2).astype(np.int64)
+        indices = starts[:, None] + np.arange(taps)[None, :]
+        left = np.maximum(indices, centers[:, None] - scale / 2)
+        right = np.minimum(indices + 1, centers[:, None] + scale / 2)
+        weights = np.clip(right - left, 0.0, None)
+    elif kind == "kaiser":
+        # Windowed sinc with the cutoff stretched to the reduction ratio
+        radius = KAISER_WIDTH * scale / 2
+        taps = int(np.ceil(2 * radius)) + 1
+        starts = np.floor(centers - radius).astype(np.int64)
+        indices = starts[:, None] + np.arange(taps)[None, :]
+        distance = (indices + 0.5 - centers[:, None]) / scale
+        window = np.i0(KAISER_ALPHA * np.sqrt(np.clip(1 - (distance / (KAISER_WIDTH / 2)) ** 2, 0.0, 1.0)))
+        weights = np.sinc(distance) * window / np.i0(KAISER_ALPHA)
+        weights[np.abs(distance) > KAISER_WIDTH / 2] = 0.0
+    else:
+        raise ValueError(f"Unsupported mip filter: {kind}")
+
+    indices = np.mod(indices, src) if wrap else np.clip(indices, 0, src - 1)
+    weights = weights / weights.sum(axis=1, keepdims=True)
+    return indices, weights.astype(np.float32)
+
+
+def _reduce_axis(image, axis, dst, kind, wrap):
+    """Reduces one axis of a float image to length dst."""
+    src = image.shape[axis]
+    if src == dst:
+        return image
+    indices, weights = _axis_weights(src, dst, kind, wrap)
+    shape = [1] * image.ndim
+    shape[axis] = dst
+    result = None
+    for tap in range(indices.shape[1]):
+        term = np.take(image, indices[:, tap], axis=axis) * weights[:, tap].reshape(shape)
+        result = term if result is None else result + term
+    return result
+
+
+def _preserve_alpha_coverage(alpha, reference, coverage):
+    """Scales an alpha plane so the fraction of texels >= reference matches coverage."""
+    if coverage <= 0.0 or coverage >= 1.0:
+        return alpha
+    threshold = np.quantile(alpha, 1.0 - coverage)
+    if threshold <= 0.0:
+        return alpha
+    return np.clip(alpha * (reference / threshold), 0.0, 1.0)
+
+
+def _normalize_normals(image):
+    """Renormalizes the first three channels of a float image as unit normals."""
+    vectors = image[..., :3] * 2.0 - 1.0
+    length = np.sqrt(np.sum(vectors * vectors, axis=-1, keepdims=True))
+    vectors /= np.maximum(length, 1e-6)
+    image[..., :3] = vectors * 0.5 + 0.5
+    return image
+
+
+def generate_mipmaps(image, filter="box", srgb=True, alpha_coverage=None, alpha_weighted=False,
+                     normal_map=False, wrap=False, min_size=None):
+    """
+    Builds a mip chain from an image array, filtering in linear light.
+
+    Every level is reduced from the float result of the previous one, so
+    rounding errors do not accumulate down the chain. Channel order is left
+    untouched, which makes the output valid for both OpenCV (BGRA) and PIL
+    (RGBA) arrays.
+
+    Args:
+        image (numpy.ndarray): HxW, HxWxC array (uint8, uint16 or float). With 2 or 4 channels
+                               the last one is treated as alpha.
+        filter (str): "box" for an area average or "kaiser" for a sharper windowed sinc.
+        srgb (bool): Decode colour channels from sRGB before filtering. Ignored for normal maps.
+        alpha_coverage (float): Alpha test reference; when set, each level's alpha is rescaled
+                                so the fraction of texels passing the test matches level 0.
+        alpha_weighted (bool): Weight colour by alpha while filtering so transparent texels
+                               do not bleed into the visible ones.
+        normal_map (bool): Treat the first three channels as a tangent-space normal and
+                           renormalize them after every reduction (e.g. for _nh textures).
+        wrap (bool): Sample across the edges as a tiling texture.
+        min_size (tuple): Optional (width, height); stops once the next level would be
+                          smaller than this in either dimension.
+
+    Returns:
+        list: Arrays from the full size image (level 0, not copied) down to 1x1,
+              each with the input dtype and channel count.
+    """
+    squeeze = image.ndim == 2
+    source = image[..., None] if squeeze else image
+    height, width, channels = source.shape
+    has_alpha = channels in (2, 4)
+    colour = slice(0, channels - 1) if has_alpha else slice(0, channels)
+
+    working = _to_float(source)
+    if normal_map:
+        srgb = False
+    if srgb:
+        working[..., colour] = srgb_to_linear(working[..., colour])
+    if has_alpha and alpha_weighted:
+        working[..., colour] *= working[..., -1:]
+
+    coverage = None
+    if has_alpha and alpha_coverage is not None:
+        coverage = float(np.mean(working[..., -1] >= alpha_coverage))
+
+    levels = [image]
+    level = 1
+    while width > 1 or height > 1:
+        next_width, next_height = get_mip_size(source.shape[1], source.shape[0], level)
+        if min_size and (next_width < min_size[0] or next_height < min_size[1]):
+            break
+
+        working = _reduce_axis(working, 0, next_height, filter, wrap)
+        working = _reduce_axis(working, 1, next_width, filter, wrap)
+        width, height = next_width, next_height
+
+        output = working.copy()
+        if has_alpha and alpha_weighted:
+            alpha = output[..., -1:]
+            output[..., colour] = np.where(alpha > 0, output[..., colour] / np.maximum(alpha, 1e-6), 0.0)
+        if coverage is not None:
+            output[..., -1] = _preserve_alpha_coverage(output[..., -1], alpha_coverage, coverage)
+        if normal_map and channels >= 3:
+            output = _normalize_normals(output)
+        if srgb:
+            output[..., colour] = linear_to_srgb(output[..., colour])
+
+        output = _from_float(output, image.dtype)
+        levels.append(output[..., 0] if squeeze else output)
+        level += 1
+
+    return levels
+
+
+def select_mip_level(levels, width, height):
+    """Returns the smallest level that is still at least width x height (level 0 if none is)."""
+    for level in reversed(levels):
+        if level.shape[1] >= width and level.shape[0] >= height:
+            return level
+    return levels[0]
@@ -1,67 +1,456 @@
 import os
+import sys
+import json
+import time
+import errno
 import shutil
+import hashlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from fswatch import FolderWatcher, DELETED, RESCAN
+from catalog import get_catalog
 
-def copy_missing_or_newer_files(source_folder, destination_folder):
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+# Copies are I/O bound, so more threads than cores still helps on SSDs and network shares
+COPY_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+COPY_CHUNK = 64 * 1024 * 1024
+FICLONE = 0x40049409  # linux/fs.h: _IOW(0x94, 9, int)
+
+# Size/mtime (and optional hash) of every source file as of its last sync, per folder pair
+SYNC_MANIFEST_FILE = "sync_manifest.json"
+
+# Watch mode: seconds a changed file must stay the same size and mtime before it is copied
+WATCH_DEBOUNCE = 1.0
+
+
+def copy_missing_or_newer_files(source_folder, destination_folder, workers=COPY_WORKERS, use_hash=False, full=False):
     """
-    Copies files from the source folder to the destination folder if they are missing
+    Copies files from the source tree to the destination tree if they are missing
     in the destination or if the source file is newer, even if extensions differ.
 
+    Subfolders are mirrored and files are matched by base name within the same
+    relative folder, ignoring extension and case. What was synced last time is kept
+    in SYNC_MANIFEST_FILE, so files whose size and mtime haven't changed since are
+    skipped without looking at the destination at all.
+
     Args:
         source_folder: Path to the source folder.
         destination_folder: Path to the destination folder.
+        workers: Number of files copied at the same time.
+        use_hash: Also store an MD5 of each synced file, so a file whose mtime changed
+                  but whose content didn't (unreliable mtimes) is not copied again.
+        full: Ignore the manifest and compare every file against the destination.
+
+    Returns:
+        dict: "copied" (sorted destination paths), "errors" (sorted (path, message) pairs),
+              "bytes", "seconds", "methods" (copy method -> file count) and "unchanged",
+              or None if a folder could not be read.
     """
 
-    try:
-        # Map files by their base name (ignoring extensions and case) in source
-        source_files = {os.path.splitext(f.lower())[0]: f for f in os.listdir(source_folder)}
-    except FileNotFoundError:
+    if not os.path.isdir(source_folder):
         print(f"Error: Source folder '{source_folder}' not found.")
-        return
-    except Exception as e:
-        print(f"Error reading source folder: {e}")
-        return
+        return None
 
     try:
         os.makedirs(destination_folder, exist_ok=True)  # Create destination if it doesn't exist
-        # Map files by their base name in destination
-        destination_files = {os.path.splitext(f.lower())[0]: f for f in os.listdir(destination_folder)}
     except Exception as e:
         print(f"Error reading/creating destination folder: {e}")
+        return None
+
+    previous = {} if full else load_sync_manifest(source_folder, destination_folder)
+    synced = {}  # Manifest entries for the next run
+    pending = {}  # Destination path -> (key, entry), recorded once the copy succeeds
+    destination_listings = {}
+    copies = []
+
+    # Decide what to copy up front, in a fixed order
+    for relative_path, size, mtime in sorted(scan_tree(source_folder)):
+        key, entry, copy_path = plan_sync(source_folder, destination_folder, relative_path, size, mtime,
+                                          previous, destination_listings, use_hash)
+        if copy_path:
+            copies.append((os.path.join(source_folder, relative_path), copy_path))
+            pending[copy_path] = (key, entry)
+        else:
+            synced[key] = entry
+
+    unchanged = len(synced)
+    summary = run_copies(copies, workers)
+    for copy_path in summary["copied"]:
+        key, entry = pending[copy_path]
+        synced[key] = entry
+    summary["unchanged"] = unchanged
+    if unchanged:
+        print(f"{unchanged} file(s) already up to date.")
+
+    try:
+        save_sync_manifest(source_folder, destination_folder, synced)
+    except OSError as e:
+        print(f"Error saving sync manifest: {e}")
+    return summary
+
+
+def plan_sync(source_folder, destination_folder, relative_path, size, mtime, manifest, listings, use_hash):
+    """
+    Decides whether one source file needs copying.
+
+    Returns:
+        tuple: (manifest key, manifest entry, destination path to copy to or None).
+    """
+    key = os.path.normcase(relative_path)
+    source_path = os.path.join(source_folder, relative_path)
+    entry = manifest.get(key)
+    if entry and is_synced(source_path, size, mtime, entry, use_hash):
+        return key, entry, None
+
+    # Changed or new: find the matching destination file by base name
+    relative_dir, file_name = os.path.split(relative_path)
+    listing = get_destination_listing(destination_folder, relative_dir, listings)
+    destination_entry = listing.get(os.path.splitext(file_name.lower())[0])
+
+    entry = create_sync_entry(source_path, size, mtime, use_hash)
+    if is_newer(mtime, destination_entry):
+        return key, entry, os.path.join(destination_folder, relative_path)
+    return key, entry, None
+
+
+def sync_paths(source_folder, destination_folder, source_paths, workers=COPY_WORKERS, use_hash=False):
+    """
+    Syncs only the given files of the source tree and updates their manifest entries.
+
+    Returns:
+        dict: See copy_missing_or_newer_files (without "unchanged").
+    """
+    manifest = load_sync_manifest(source_folder, destination_folder)
+    listings = {}
+    pending = {}
+    copies = []
+    for source_path in sorted(source_paths):
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            continue  # Deleted again before the batch ran
+        relative_path = os.path.relpath(source_path, source_folder)
+        key, entry, copy_path = plan_sync(source_folder, destination_folder, relative_path, stat.st_size,
+                                          stat.st_mtime_ns, manifest, listings, use_hash)
+        if copy_path:
+            copies.append((source_path, copy_path))
+            pending[copy_path] = (key, entry)
+        else:
+            manifest[key] = entry
+
+    summary = run_copies(copies, workers)
+    for copy_path in summary["copied"]:
+        key, entry = pending[copy_path]
+        manifest[key] = entry
+
+    try:
+        save_sync_manifest(source_folder, destination_folder, manifest)
+    except OSError as e:
+        print(f"Error saving sync manifest: {e}")
+    return summary
+
+
+def collect_settled(pending, debounce):
+    """
+    Removes and returns the pending paths whose size and mtime have stayed the same
+    for debounce seconds; anything that changed since the last look starts over.
+
+    Args:
+        pending: Source path -> ((size, mtime) or None, time.monotonic() it was last seen changing).
+    """
+    now = time.monotonic()
+    ready = []
+    for path, (signature, since) in list(pending.items()):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            del pending[path]  # Deleted or renamed while waiting
+            continue
+        current = (stat.st_size, stat.st_mtime_ns)
+        if current != signature:
+            pending[path] = (current, now)  # Still being written
+        elif now - since >= debounce:
+            ready.append(path)
+            del pending[path]
+    return sorted(ready)
+
+
+def watch_and_sync(source_folder, destination_folder, workers=COPY_WORKERS, use_hash=False, debounce=WATCH_DEBOUNCE):
+    """
+    Keeps the destination in sync with the source until interrupted with Ctrl+C.
+
+    After one incremental sync, changes reported by FolderWatcher (inotify, or
+    polling where that isn't available) wait until each file has stopped changing
+    for debounce seconds. A burst of writes, such as the five outputs
+    combine_textures writes per asset, is then copied as one batch, and files
+    still being written are left alone until they are finished.
+    """
+    if copy_missing_or_newer_files(source_folder, destination_folder, workers, use_hash) is None:
         return
 
-    files_copied = 0
-    for base_name, source_filename in source_files.items():
-        source_path = os.path.join(source_folder, source_filename)
-        destination_file = destination_files.get(base_name)  # Find matching file by base name
-        destination_path = os.path.join(destination_folder, destination_file) if destination_file else None
-
-        # Determine if the file needs to be copied
-        if not destination_path or not os.path.exists(destination_path):
-            # File is missing in the destination folder
-            copy_file(source_path, os.path.join(destination_folder, source_filename))
-            files_copied += 1
-        elif os.path.getmtime(source_path) > os.path.getmtime(destination_path):
-            # File exists but is older in the destination folder
-            copy_file(source_path, os.path.join(destination_folder, source_filename))
-            files_copied += 1
-
-    if files_copied == 0:
+    watcher = FolderWatcher([source_folder])
+    print(f"Watching '{source_folder}' ({watcher.mode}). Press Ctrl+C to stop.")
+    pending = {}
+    try:
+        while True:
+            for kind, path in watcher.get_events(timeout=debounce / 2):
+                if kind == RESCAN:
+                    pending.clear()
+                    copy_missing_or_newer_files(source_folder, destination_folder, workers, use_hash)
+                elif kind == DELETED:
+                    pending.pop(path, None)
+                else:
+                    pending[path] = (None, time.monotonic())  # Must look unchanged on the next check
+
+            ready = collect_settled(pending, debounce)
+            if ready:
+                sync_paths(source_folder, destination_folder, ready, workers, use_hash)
+    except KeyboardInterrupt:
+        print("Stopped watching.")
+    finally:
+        watcher.close()
+
+
+def scan_tree(folder):
+    """Returns (relative path, size, mtime) for every file below folder, from a refresh of the asset catalog."""
+    catalog = get_catalog()
+    catalog.refresh(folder)
+    root = os.path.abspath(folder)
+    return [(os.path.relpath(entry.path, root), entry.size, entry.mtime) for entry in catalog.files(folder)]
+
+
+def get_destination_listing(destination_folder, relative_dir, listings):
+    """Returns base name -> CatalogEntry for one destination folder, refreshing each folder at most once."""
+    if relative_dir not in listings:
+        folder = os.path.join(destination_folder, relative_dir)
+        catalog = get_catalog()
+        catalog.refresh(folder, recursive=False)
+        listings[relative_dir] = {entry.base_name: entry for entry in catalog.files(folder, recursive=False)}
+    return listings[relative_dir]
+
+
+def is_newer(source_mtime, destination_entry):
+    """Returns True if the destination is missing or older than the source (mtimes in nanoseconds)."""
+    return destination_entry is None or source_mtime > destination_entry.mtime
+
+
+def get_sync_key(source_folder, destination_folder):
+    return f"{os.path.normcase(os.path.abspath(source_folder))}|{os.path.normcase(os.path.abspath(destination_folder))}"
+
+
+def load_sync_manifest(source_folder, destination_folder):
+    """Loads the last-synced state of a source/destination pair: relative source path -> entry."""
+    if os.path.exists(SYNC_MANIFEST_FILE):
+        try:
+            with open(SYNC_MANIFEST_FILE, "r") as f:
+                return json.load(f).get("syncs", {}).get(get_sync_key(source_folder, destination_folder), {})
+        except (json.JSONDecodeError, OSError):
+            return {}
+    return {}
+
+
+def save_sync_manifest(source_folder, destination_folder, entries):
+    """Replaces one pair's entries in the manifest, leaving other pairs alone."""
+    syncs = {}
+    if os.path.exists(SYNC_MANIFEST_FILE):
+        try:
+            with open(SYNC_MANIFEST_FILE, "r") as f:
+                syncs = json.load(f).get("syncs", {})
+        except (json.JSONDecodeError, OSError):
+            syncs = {}
+    syncs[get_sync_key(source_folder, destination_folder)] = entries
+
+    temp_path = SYNC_MANIFEST_FILE + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump({"syncs": syncs}, f)
+    os.replace(temp_path, SYNC_MANIFEST_FILE)
+
+
+def calculate_md5(file_path):
+    """Calculate the MD5 hash of a file."""
+    hash_md5 = hashlib.md5()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            hash_md5.update(chunk)
+    return hash_md5.hexdigest()
+
+
+def create_sync_entry(source_path, size, mtime, use_hash):
+    """Builds the manifest record of a source file as it is synced now."""
+    return {
+        "size": size,
+        "mtime": mtime,
+        "hash": calculate_md5(source_path) if use_hash else None,
+    }
+
+
+def is_synced(source_path, size, mtime, entry, use_hash):
+    """
+    Checks a source against its manifest entry using the size and mtime from the scan.
+
+    Returns:
+        True if the file hasn't changed since it was last synced. With use_hash, a
+        changed mtime alone is confirmed against the stored hash (and the entry's
+        mtime updated) before the file counts as changed.
+    """
+    if entry["size"] != size:
+        return False
+    if entry["mtime"] == mtime:
+        return True
+    if not use_hash or not entry.get("hash"):
+        return False
+
+    try:
+        if calculate_md5(source_path) == entry["hash"]:
+            entry["mtime"] = mtime
+            return True
+    except OSError:
+        pass
+    return False
+
+
+def run_copies(copies, workers=COPY_WORKERS):
+    """
+    Copies (source, destination) pairs on a thread pool and prints a deterministic summary.
+
+    Missing destination folders are created first.
+
+    Returns:
+        dict: See copy_missing_or_newer_files.
+    """
+    summary = {"copied": [], "errors": [], "bytes": 0, "seconds": 0.0, "methods": {}}
+    start = time.perf_counter()
+
+    for destination_dir in sorted({os.path.dirname(destination) for _, destination in copies}):
+        try:
+            os.makedirs(destination_dir, exist_ok=True)
+        except OSError:
+            pass  # Reported by the copies into it
+
+    if copies:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(copies)))) as pool:
+            futures = {pool.submit(copy_file, source, destination): (source, destination)
+                       for source, destination in copies}
+            for future in as_completed(futures):
+                source, destination = futures[future]
+                try:
+                    copied_bytes, method = future.result()
+                except Exception as e:
+                    summary["errors"].append((source, str(e)))
+                    continue
+                summary["copied"].append(destination)
+                summary["bytes"] += copied_bytes
+                summary["methods"][method] = summary["methods"].get(method, 0) + 1
+
+    summary["seconds"] = time.perf_counter() - start
+    summary["copied"].sort()
+    summary["errors"].sort()
+    print_copy_summary(summary)
+    return summary
+
+
+def print_copy_summary(summary):
+    """Prints the copied files, errors and throughput of a sync, in sorted order."""
+    for error_path, message in summary["errors"]:
+        print(f"Error copying {error_path}: {message}")
+
+    if not summary["copied"]:
         print("No files were copied.")
-    else:
-        print(f"Copied {files_copied} file(s).")
+        return
+
+    megabytes = summary["bytes"] / (1024 * 1024)
+    rate = megabytes / summary["seconds"] if summary["seconds"] > 0 else 0.0
+    methods = ", ".join(f"{method}: {count}" for method, count in sorted(summary["methods"].items()))
+    print(f"Copied {len(summary['copied'])} file(s), {megabytes:.1f} MB in {summary['seconds']:.2f}s "
+          f"({rate:.1f} MB/s; {methods}).")
+
+
+def _clone_file(source_fd, destination_fd):
+    """Makes the destination share the source's data blocks (btrfs, XFS). Returns False if unsupported."""
+    if fcntl is None:
+        return False
+    try:
+        fcntl.ioctl(destination_fd, FICLONE, source_fd)
+        return True
+    except OSError:
+        return False
+
+
+def _copy_in_kernel(source_fd, destination_fd, size):
+    """
+    Copies size bytes without passing them through Python.
+
+    Returns:
+        tuple: (bytes copied, "copy_file_range" or "sendfile").
+    """
+    method = "copy_file_range" if hasattr(os, "copy_file_range") else "sendfile"
+    copied = 0
+    while copied < size:
+        count = min(COPY_CHUNK, size - copied)
+        if method == "copy_file_range":
+            try:
+                sent = os.copy_file_range(source_fd, destination_fd, count, copied, copied)
+            except OSError as e:
+                # Cross-filesystem on older kernels, or unsupported by the filesystem
+                if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                    raise
+                method = "sendfile"
+                continue
+        else:
+            os.lseek(destination_fd, copied, os.SEEK_SET)
+            sent = os.sendfile(destination_fd, source_fd, copied, count)
+        if sent == 0:
+            break  # The source got shorter while copying
+        copied += sent
+    return copied, method
 
 
 def copy_file(source_path, destination_path):
-    """Copies a single file and handles errors."""
+    """
+    Copies a single file with its metadata.
+
+    The data goes to a temporary file next to the destination, which then replaces it,
+    so a failed copy never leaves a truncated file behind with a fresh mtime. On Linux
+    a reflink is tried first, then copy_file_range/sendfile; elsewhere shutil.copy2 is
+    used. Errors are raised for the caller to collect.
+
+    Returns:
+        tuple: (bytes copied, method used).
+    """
+    fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(destination_path)}.", suffix=".tmp",
+                                     dir=os.path.dirname(destination_path) or ".")
     try:
-        shutil.copy2(source_path, destination_path)  # copy2 preserves metadata
-        print(f"Copied: {source_path} to {destination_path}")
-    except Exception as e:
-        print(f"Error copying {source_path}: {e}")
+        if not sys.platform.startswith("linux"):
+            os.close(fd)
+            shutil.copy2(source_path, temp_path)  # copy2 preserves metadata
+            copied, method = os.path.getsize(temp_path), "copy2"
+        else:
+            with os.fdopen(fd, "wb") as destination, open(source_path, "rb") as source:
+                size = os.fstat(source.fileno()).st_size
+                if _clone_file(source.fileno(), destination.fileno()):
+                    copied, method = size, "reflink"
+                else:
+                    copied, method = _copy_in_kernel(source.fileno(), destination.fileno(), size)
+            shutil.copystat(source_path, temp_path)
+        os.replace(temp_path, destination_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    return copied, method
 
 
 if __name__ == "__main__":
     source_folder = "staging/textures/"  # Replace with the actual path
     destination_folder = "staging/openmwassets/textures"  # Replace with the actual path
 
-    copy_missing_or_newer_files(source_folder, destination_folder)
+    if "--watch" in sys.argv[1:]:
+        watch_and_sync(source_folder, destination_folder)
+    else:
+        copy_missing_or_newer_files(source_folder, destination_folder)
@@ -0,0 +1,37 @@
+import shutil
+
+from PIL import Image
+
+from catalog import Catalog
+
+
+def test_walk_yields_each_folder_and_drops_removed_ones(tmp_path):
+    root = tmp_path / "textures"
+    (root / "a").mkdir(parents=True)
+    (root / "b").mkdir()
+    (root / "a" / "tx_a.png").write_bytes(b"a")
+    (root / "b" / "tx_b_nh.png").write_bytes(b"b")
+    catalog = Catalog(str(tmp_path / "catalog.db"))
+
+    walked = [(folder, [entry.name for entry in entries]) for folder, entries in catalog.walk(str(root))]
+
+    assert walked == [(str(root), []), (str(root / "a"), ["tx_a.png"]), (str(root / "b"), ["tx_b_nh.png"])]
+    assert catalog.get(str(root / "b" / "tx_b_nh.png")).role == "_nh"
+
+    shutil.rmtree(root / "b")
+    assert catalog.refresh(str(root)) == (0, 1)
+    assert catalog.get(str(root / "b" / "tx_b_nh.png")) is None
+
+
+def test_headers_are_only_read_when_asked(tmp_path):
+    folder = tmp_path / "textures"
+    folder.mkdir()
+    Image.new("RGBA", (8, 4)).save(folder / "tx_small.png")
+    catalog = Catalog(str(tmp_path / "catalog.db"))
+
+    catalog.refresh(str(folder), recursive=False)
+    assert catalog.get(str(folder / "tx_small.png")).width is None
+
+    assert catalog.refresh(str(folder), recursive=False, read_headers=True) == (1, 0)
+    entry = catalog.get(str(folder / "tx_small.png"))
+    assert (entry.width, entry.height) == (8, 4)
@@ -0,0 +1,174 @@
+import time
+import threading
+import multiprocessing
+
+import catalog
+import conv
+
+
+def plan_stub(image_path):
+    """Plans every file as a tiny BC1 texture without reading it."""
+    return image_path, "planned", None, {"format": "BC1_UNORM", "width": 4, "height": 4}
+
+
+def convert_stub(output_dir, format_name, image_paths):
+    """Reports every file of a batch as converted without running texconv."""
+    return [(image_path, "converted", None) for image_path in image_paths]
+
+
+def test_process_folder_finishes_with_more_batches_than_the_limits(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(catalog, "_catalog", None)  # Catalog in tmp_path, not the working copy
+    monkeypatch.setattr(multiprocessing, "cpu_count", lambda: 2)
+    monkeypatch.setattr(conv, "check_and_plan_image", plan_stub)
+    monkeypatch.setattr(conv, "run_texconv_batch", convert_stub)
+    conv.close_pool()  # Workers must be forked after the stubs are in place
+
+    # Far more files than in_flight (16 per worker) plus pending batches (2 per worker) can hold
+    source_folder = tmp_path / "textures"
+    source_folder.mkdir()
+    file_count = 400
+    for index in range(file_count):
+        (source_folder / f"tx_{index}.png").write_bytes(b"")
+
+    results = {}
+    cancel_event = threading.Event()
+    worker = threading.Thread(target=lambda: results.update(conv.process_folder(str(source_folder), None, cancel_event)),
+                              daemon=True)
+    try:
+        worker.start()
+        worker.join(timeout=30)
+        assert not worker.is_alive(), "process_folder did not finish"
+    finally:
+        cancel_event.set()  # Lets a stuck producer return so the pool can be torn down
+        if conv._pool is not None:
+            conv._pool.terminate()
+            conv._pool = None
+        conv.close_pool()
+
+    assert results["converted"] == file_count
+    assert results["done"] == file_count
+    assert results["failed"] == 0
+
+
+def test_parse_texconv_output_keeps_parentheses_in_file_names():
+    plain = "/x/foo.png"
+    numbered = "/x/foo (1).png"
+    failed = "/x/bar (2).png"
+    output = "\n".join([
+        f"reading {plain} (512x512,10 R8G8B8A8_UNORM 2D)",
+        "writing /x/foo.dds",
+        f"reading {numbered} (512x512,10 R8G8B8A8_UNORM 2D)",
+        "writing /x/foo (1).dds",
+        f"reading {failed} FAILED (80070002: The system cannot find the file specified.)",
+    ])
+
+    results = conv.parse_texconv_output(output, [plain, numbered, failed])
+
+    assert results == {plain: True, numbered: True, failed: False}
+
+
+def test_process_folder_failure_does_not_block_later_runs(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(catalog, "_catalog", None)
+    monkeypatch.setattr(multiprocessing, "cpu_count", lambda: 2)
+    monkeypatch.setattr(conv, "check_and_plan_image", plan_stub)
+    monkeypatch.setattr(conv, "run_texconv_batch", convert_stub)
+    conv.close_pool()
+
+    source_folder = tmp_path / "textures"
+    source_folder.mkdir()
+    for index in range(200):
+        (source_folder / f"tx_{index}.png").write_bytes(b"")
+
+    def fail_on_first_result(counts):
+        raise RuntimeError("progress callback failed")
+
+    results = {}
+
+    def run():
+        try:
+            conv.process_folder(str(source_folder), fail_on_first_result)
+        except RuntimeError:
+            pass
+        results.update(conv.process_folder(str(source_folder)))
+
+    worker = threading.Thread(target=run, daemon=True)
+    try:
+        worker.start()
+        worker.join(timeout=30)
+        assert not worker.is_alive(), "the run after a failed one did not finish"
+    finally:
+        if conv._pool is not None:
+            conv._pool.terminate()
+            conv._pool = None
+        conv.close_pool()
+
+    assert results["failed"] == 0
+    assert results["done"] + results["skipped"] > 0
+
+
+def slow_convert_stub(output_dir, format_name, image_paths):
+    time.sleep(0.5)
+    return convert_stub(output_dir, format_name, image_paths)
+
+
+def test_close_pool_cancels_a_running_conversion(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(catalog, "_catalog", None)
+    monkeypatch.setattr(multiprocessing, "cpu_count", lambda: 2)
+    monkeypatch.setattr(conv, "check_and_plan_image", plan_stub)
+    monkeypatch.setattr(conv, "run_texconv_batch", slow_convert_stub)
+    conv.close_pool()
+
+    source_folder = tmp_path / "textures"
+    source_folder.mkdir()
+    file_count = 2000  # About 30 seconds of batches at 2 workers
+    for index in range(file_count):
+        (source_folder / f"tx_{index}.png").write_bytes(b"")
+
+    started = threading.Event()
+    results = {}
+    worker = threading.Thread(target=lambda: results.update(conv.process_folder(str(source_folder),
+                                                                                lambda counts: started.set())),
+                              daemon=True)
+    worker.start()
+    assert started.wait(timeout=30)
+
+    start = time.monotonic()
+    conv.close_pool()
+    assert time.monotonic() - start < 5
+    worker.join(timeout=10)
+
+    assert not worker.is_alive()
+    assert results["cancelled"]
+    assert results["converted"] < file_count
+
+
+def test_analyze_folder_lists_unknown_formats_and_prunes_the_cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(catalog, "_catalog", None)
+
+    def read_metadata(image_path):
+        if "odd" in image_path:
+            return {"width": 64, "height": 64, "format": "UNMAPPED_FORMAT", "mips": 1, "bits": None, "layers": 1}
+        return {"width": 64, "height": 64, "format": "BC1_UNORM", "mips": 1, "bits": 4, "layers": 1}
+
+    monkeypatch.setattr(conv, "read_texture_metadata", read_metadata)
+    source_folder = tmp_path / "textures"
+    source_folder.mkdir()
+    (source_folder / "tx_plain.dds").write_bytes(b"plain")
+    (source_folder / "tx_odd.dds").write_bytes(b"odd")
+
+    textures = conv.analyze_folder(str(source_folder))
+
+    unknown = [t["path"] for t in textures if t.get("unknown")]
+    assert unknown == [str(source_folder / "tx_odd.dds")]
+    report = conv.format_analysis_report(textures, budget_bytes=1)
+    assert "Unknown format (not counted above):" in report
+    assert "tx_odd.dds: UNMAPPED_FORMAT" in report
+
+    (source_folder / "tx_odd.dds").unlink()
+    conv.analyze_folder(str(source_folder))
+
+    assert list(conv.load_analysis_cache()) == [conv.get_manifest_key(str(source_folder / "tx_plain.dds"))]
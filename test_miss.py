@@ -0,0 +1,42 @@
+import os
+
+import pytest
+
+import miss
+
+
+def test_copy_file_replaces_the_destination(tmp_path):
+    source = tmp_path / "tx_a.dds"
+    destination = tmp_path / "deployed" / "tx_a.dds"
+    destination.parent.mkdir()
+    source.write_bytes(b"new data")
+    destination.write_bytes(b"old")
+    os.utime(source, ns=(1_000_000_000, 1_000_000_000))
+
+    copied, _ = miss.copy_file(str(source), str(destination))
+
+    assert copied == len(b"new data")
+    assert destination.read_bytes() == b"new data"
+    assert os.stat(destination).st_mtime_ns == 1_000_000_000
+    assert os.listdir(destination.parent) == ["tx_a.dds"]
+
+
+def test_failed_copy_leaves_the_destination_untouched(tmp_path, monkeypatch):
+    source = tmp_path / "tx_a.dds"
+    destination = tmp_path / "deployed" / "tx_a.dds"
+    destination.parent.mkdir()
+    source.write_bytes(b"new data")
+    destination.write_bytes(b"old")
+
+    def fail(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(miss, "_clone_file", lambda source_fd, destination_fd: False)
+    monkeypatch.setattr(miss, "_copy_in_kernel", fail)
+    monkeypatch.setattr(miss.shutil, "copy2", fail)
+
+    with pytest.raises(OSError):
+        miss.copy_file(str(source), str(destination))
+
+    assert destination.read_bytes() == b"old"
+    assert os.listdir(destination.parent) == ["tx_a.dds"]